@@ -0,0 +1,38 @@
+"""
+Celery app with three routed queues, each run by its own worker so live
+calls never wait behind batch work:
+
+live     STT / LLM / TTS for a turn while the candidate is on the line
+scoring  end-of-call scoring
+bulk     re-scoring and exports over many candidates
+
+Start one worker per queue with `python manage.py run_worker <queue>`.
+"""
+import os
+
+from celery import Celery
+from kombu import Exchange, Queue
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+
+app = Celery("config")
+app.config_from_object("django.conf:settings", namespace="CELERY")
+
+QUEUES = ("live", "scoring", "bulk")
+MAX_PRIORITY = 9
+
+app.conf.task_queues = [
+    Queue(name, Exchange(name), routing_key=name, queue_arguments={"x-max-priority": MAX_PRIORITY})
+    for name in QUEUES
+]
+app.conf.task_default_queue = "bulk"
+app.conf.task_default_priority = 0
+
+app.conf.task_routes = {
+    "interview.tasks.process_candidate_answer": {"queue": "live", "routing_key": "live", "priority": 9},
+    "interview.tasks.score_interview": {"queue": "scoring", "routing_key": "scoring", "priority": 5},
+    "interview.tasks.rescore_candidates": {"queue": "bulk", "routing_key": "bulk", "priority": 0},
+    "interview.tasks.export_candidates_file": {"queue": "bulk", "routing_key": "bulk", "priority": 0},
+}
+
+app.autodiscover_tasks()
@@ -1,5 +1,90 @@
 from django.contrib import admin
-from .models import Candidate
+from django.core.paginator import Paginator
+from django.db import connection
+from django.utils.functional import cached_property
+
+from .models import Candidate, Campaign, CallJob, LLMUsage
+from .services.admission import MANUAL_CAMPAIGN
+from .services.candidate_import import normalize_phone
+from .services.dialer import enqueue
+
+# Below this many rows an exact COUNT(*) is cheap enough
+ESTIMATE_COUNT_THRESHOLD = 100_000
+
+
+def estimated_row_count(model):
+    table = model._meta.db_table
+
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE relname = %s", [table])
+        elif connection.vendor == "sqlite":
+            # rowid is the primary key, so MAX is an index lookup
+            cursor.execute(f'SELECT MAX(rowid) FROM "{table}"')
+        else:
+            return None
+        row = cursor.fetchone()
+
+    return row[0] if row and row[0] and row[0] > 0 else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """Uses the planner's row estimate for the unfiltered changelist of big tables."""
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, "query", None)
+        if query is not None and not query.where:
+            estimate = estimated_row_count(self.object_list.model)
+            if estimate and estimate > ESTIMATE_COUNT_THRESHOLD:
+                return estimate
+        return super().count
+
+
+class ScoreBandFilter(admin.SimpleListFilter):
+    title = "score band"
+    parameter_name = "score_band"
+
+    # Same cut-offs as the decision in ai_analysis
+    BANDS = {
+        "strong": (67, None),
+        "consider": (55, 67),
+        "less": (40, 55),
+        "reject": (None, 40),
+    }
+
+    def lookups(self, request, model_admin):
+        return [
+            ("strong", "67+"),
+            ("consider", "55-66"),
+            ("less", "40-54"),
+            ("reject", "below 40"),
+        ]
+
+    def queryset(self, request, queryset):
+        band = self.BANDS.get(self.value())
+        if band is None:
+            return queryset
+
+        low, high = band
+        if low is not None:
+            queryset = queryset.filter(final_score__gte=low)
+        if high is not None:
+            queryset = queryset.filter(final_score__lt=high)
+        return queryset
+
+
+def queue_on_campaign(campaign):
+    def action(modeladmin, request, queryset):
+        jobs = enqueue(campaign, queryset)
+        skipped = queryset.count() - len(jobs)
+        modeladmin.message_user(
+            request,
+            f"Queued {len(jobs)} candidate(s) on {campaign.name}; "
+            f"{skipped} already interviewed or queued."
+        )
+    return action
+
 
 @admin.register(Candidate)
 class CandidateAdmin(admin.ModelAdmin):
@@ -9,3 +94,79 @@ class CandidateAdmin(admin.ModelAdmin):
         "decision",
         "created_at",
     )
+    list_filter = ("decision", ScoreBandFilter, "created_at")
+    search_fields = ("phone",)
+    search_help_text = "Exact phone number"
+    ordering = ("-created_at",)
+    sortable_by = ("final_score", "decision", "created_at")
+
+    list_per_page = 50
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    # Transcripts, red flags and summaries stay out of the list query
+    LIST_FIELDS = ("id", "phone", "final_score", "decision", "created_at")
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        match = request.resolver_match
+        if match and match.url_name == "interview_candidate_changelist":
+            queryset = queryset.only(*self.LIST_FIELDS)
+        return queryset
+
+    def get_actions(self, request):
+        # One "queue on <campaign>" action per active campaign
+        actions = super().get_actions(request)
+        for campaign in Campaign.objects.filter(active=True).exclude(name=MANUAL_CAMPAIGN):
+            name = f"queue_on_campaign_{campaign.id}"
+            actions[name] = (queue_on_campaign(campaign), name, f"Queue on campaign: {campaign.name}")
+        return actions
+
+    def get_search_results(self, request, queryset, search_term):
+        # Exact match hits the unique phone index instead of a LIKE scan
+        term = search_term.strip()
+        if not term:
+            return queryset, False
+        return queryset.filter(phone__in={term, normalize_phone(term)} - {None}), False
+
+
+@admin.register(Campaign)
+class CampaignAdmin(admin.ModelAdmin):
+    list_display = (
+        "name",
+        "active",
+        "calls_per_second",
+        "max_concurrent",
+        "window_start",
+        "window_end",
+    )
+
+
+@admin.register(CallJob)
+class CallJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "candidate",
+        "campaign",
+        "status",
+        "attempts",
+        "last_result",
+        "next_attempt_at",
+    )
+    list_filter = ("status", "campaign")
+    raw_id_fields = ("candidate",)
+
+
+@admin.register(LLMUsage)
+class LLMUsageAdmin(admin.ModelAdmin):
+    list_display = (
+        "created_at",
+        "candidate",
+        "site",
+        "model",
+        "prompt_tokens",
+        "completion_tokens",
+        "latency_ms",
+        "cost_usd",
+    )
+    list_filter = ("site", "model", "created_at")
+    raw_id_fields = ("candidate",)
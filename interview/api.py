@@ -0,0 +1,94 @@
+import hashlib
+import json
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.dateparse import parse_datetime
+from django.utils.http import quote_etag
+from rest_framework import viewsets
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from interview.models import Candidate
+from interview.serializers import CandidateSerializer, ResultSerializer, selected_fields
+from interview.services.search import search_answers
+
+
+class UpdatedCursorPagination(CursorPagination):
+    # Stable order backed by the (updated_at, id) index
+    ordering = ("updated_at", "id")
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 1000
+
+
+class ConditionalListMixin:
+    """
+    The ETag is built from the query and the filtered rows' count and
+    MAX(updated_at) to the microsecond, so unchanged polls return 304 before
+    any page is fetched. No Last-Modified: HTTP dates are whole seconds and
+    would hide changes made in the same second as the previous response.
+    """
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+
+        state = queryset.aggregate(last=Max("updated_at"), rows=Count("id"))
+        version = json.dumps([request.get_full_path(), state["last"], state["rows"]], default=str)
+        etag = quote_etag(hashlib.md5(version.encode()).hexdigest())
+
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+
+        response = super().list(request, *args, **kwargs)
+        response["ETag"] = etag
+        return response
+
+
+class CandidateQuerysetMixin:
+    def get_queryset(self):
+        queryset = self.base_queryset()
+
+        updated_since = self.request.query_params.get("updated_since")
+        if updated_since:
+            since = parse_datetime(updated_since)
+            if since is None:
+                raise ValidationError({"updated_since": "Expected an ISO 8601 datetime"})
+            queryset = queryset.filter(updated_at__gt=since)
+
+        # Only load the columns that will be serialized
+        fields = selected_fields(self.get_serializer_class(), self.request.query_params)
+        return queryset.only(*(fields | {"id", "updated_at"}))
+
+
+class CandidateViewSet(ConditionalListMixin, CandidateQuerysetMixin, viewsets.ReadOnlyModelViewSet):
+    serializer_class = CandidateSerializer
+    pagination_class = UpdatedCursorPagination
+
+    def base_queryset(self):
+        return Candidate.objects.all()
+
+
+class ResultViewSet(ConditionalListMixin, CandidateQuerysetMixin, viewsets.ReadOnlyModelViewSet):
+    """Candidates whose interview has been scored."""
+    serializer_class = ResultSerializer
+    pagination_class = UpdatedCursorPagination
+
+    def base_queryset(self):
+        return Candidate.objects.exclude(decision="")
+
+
+class AnswerSearchView(APIView):
+    """GET /api/search/?q=kubernetes production outage&limit=20"""
+
+    def get(self, request):
+        try:
+            limit = max(1, min(int(request.query_params.get("limit", 20)), 100))
+        except ValueError:
+            raise ValidationError({"limit": "Expected an integer"})
+
+        query = request.query_params.get("q", "")
+        return Response({"query": query, "results": search_answers(query, limit)})
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class InterviewConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'interview'
+
+    def ready(self):
+        from interview import metrics, tracing
+        tracing.connect_celery()
+        metrics.connect_celery()
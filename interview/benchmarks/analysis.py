@@ -0,0 +1,100 @@
+# interview/benchmarks/analysis.py
+"""Synthetic interviews and benchmark cases for the CPU side of ai_analysis."""
+import json
+import random
+
+from interview.services.ai_analysis import (
+    extract_answers_from_conversation,
+    local_invalid_check,
+    enforce_real_world_floors,
+    apply_experience_bonus,
+    safe_json_extract,
+    build_hr_summary,
+    pair_questions_and_answers,
+)
+
+TURN_COUNTS = (5, 10, 25, 50, 100, 200)
+
+INTENTS = ["intro", "technical", "project", "problem", "challenge", "communication", "team"]
+
+QUESTIONS = [
+    "Tell me about yourself and your current role.",
+    "Which backend frameworks have you used in production?",
+    "Describe a production outage you handled and what you changed afterwards.",
+    "How do you explain a technical trade-off to a non-technical stakeholder?",
+    "How would you scale an API that suddenly gets ten times the traffic?",
+]
+
+ANSWER_WORDS = (
+    "i have four years of experience with django flask and postgres in production "
+    "we had a latency issue and a bottleneck in the deployment pipeline so i debugged "
+    "it optimized the queries and migrated services to docker on aws owned the "
+    "architecture for real users and clients um you know basically"
+).split()
+
+REFUSALS = ["I don't know.", "No idea about that.", "Skip this one please."]
+
+
+def synthetic_conversation(turns, seed=0):
+    """Alternating AI questions and candidate answers, `turns` entries long."""
+    rng = random.Random(seed)
+    conversation = [{"role": "ai", "type": "intro", "intent": "intro", "text": "Hello."}]
+
+    while len(conversation) < turns:
+        conversation.append({
+            "role": "ai",
+            "type": "question",
+            "intent": rng.choice(INTENTS),
+            "text": rng.choice(QUESTIONS),
+        })
+
+        if rng.random() < 0.1:
+            answer = rng.choice(REFUSALS)
+        else:
+            answer = " ".join(rng.choices(ANSWER_WORDS, k=rng.randint(20, 120)))
+
+        conversation.append({"role": "candidate", "type": "answer", "text": answer})
+
+    return conversation[:turns]
+
+
+def synthetic_groq_output(pairs, seed=0):
+    rng = random.Random(seed)
+    payload = {"results": [
+        {
+            "question": p["question"],
+            "communication": rng.randint(0, 10),
+            "justification": rng.randint(0, 10),
+            "confidence_without_content": False,
+            "scripted_sounding": False,
+            "reasoning": rng.choice(["vague answer", "no examples given", "clear and concrete"]),
+        }
+        for p in pairs
+    ]}
+    return "Here is the evaluation:\n" + json.dumps(payload, indent=2) + "\n"
+
+
+def build_cases(turns):
+    """Returns {name: zero-arg callable} exercising each hot function at this size."""
+    conversation = synthetic_conversation(turns, seed=turns)
+    pairs = pair_questions_and_answers(conversation)
+    answers = [p["answer"] for p in pairs]
+    raw_output = synthetic_groq_output(pairs, seed=turns)
+    notes = [
+        {**r, "answer": p["answer"]}
+        for p, r in zip(pairs, json.loads(raw_output.split(":", 1)[1])["results"])
+    ]
+
+    def floors_and_bonus():
+        for p in pairs:
+            comm, just = enforce_real_world_floors(p["answer"], 4.0, 3.0)
+            apply_experience_bonus(p, comm, just)
+
+    return {
+        "pair_questions_and_answers": lambda: pair_questions_and_answers(conversation),
+        "extract_answers_from_conversation": lambda: extract_answers_from_conversation(conversation),
+        "local_invalid_check": lambda: [local_invalid_check(a) for a in answers],
+        "enforce_floors_and_bonus": floors_and_bonus,
+        "safe_json_extract": lambda: safe_json_extract(raw_output),
+        "build_hr_summary": lambda: build_hr_summary(62, "CONSIDER", ["Question 2: Explicitly declined to answer"], notes),
+    }
@@ -0,0 +1,85 @@
+# interview/loadtest/caller.py
+"""Plays Twilio's webhook sequence for one call against a running server."""
+import random
+import time
+import uuid
+import xml.etree.ElementTree as ET
+from urllib.parse import urlsplit
+
+import requests
+
+READY_REPLY = "Yes, I am ready. Let's start the interview."
+
+
+def webhook_path(url):
+    parts = urlsplit(url)
+    return parts.path + (f"?{parts.query}" if parts.query else "")
+
+
+class SimulatedCall:
+    def __init__(self, target, recordings_base, answer_seconds=20, max_turns=20):
+        self.target = target.rstrip("/")
+        self.recordings_base = recordings_base.rstrip("/")
+        self.answer_seconds = answer_seconds
+        self.max_turns = max_turns
+
+        self.call_sid = "CA" + uuid.uuid4().hex
+        self.phone = "+1555" + "".join(random.choices("0123456789", k=7))
+        self.session = requests.Session()
+
+        self.latencies = []
+        self.errors = 0
+        self.completed = False
+
+    def post(self, path, data=None):
+        payload = {"CallSid": self.call_sid, "To": self.phone, "From": "+15550000000"}
+        payload.update(data or {})
+
+        start = time.perf_counter()
+        try:
+            r = self.session.post(f"{self.target}{path}", data=payload, timeout=60)
+            r.raise_for_status()
+        except requests.RequestException:
+            self.errors += 1
+            return None
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+
+        return ET.fromstring(r.content)
+
+    def next_request(self, twiml):
+        """What Twilio would post next after executing the TwiML."""
+        for verb in twiml:
+            if verb.tag == "Hangup":
+                return None
+
+            if verb.tag == "Gather":
+                return webhook_path(verb.get("action")), {"SpeechResult": READY_REPLY}
+
+            if verb.tag == "Record":
+                return webhook_path(verb.get("action")), {
+                    "RecordingUrl": f"{self.recordings_base}/recordings/RE{uuid.uuid4().hex}",
+                    "RecordingDuration": str(self.answer_seconds),
+                }
+
+            if verb.tag == "Redirect":
+                return webhook_path(verb.text), {}
+
+        return None
+
+    def run(self):
+        twiml = self.post("/voice/")
+
+        for _ in range(self.max_turns):
+            if twiml is None:
+                return self
+
+            step = self.next_request(twiml)
+            if step is None:
+                self.completed = True
+                return self
+
+            path, data = step
+            twiml = self.post(path, data)
+
+        return self
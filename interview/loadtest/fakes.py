@@ -0,0 +1,221 @@
+# interview/loadtest/fakes.py
+"""
+Local stand-ins for Twilio recordings, Groq (chat + Whisper) and Murf TTS,
+with configurable latency and error distributions.
+"""
+import functools
+import io
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+import wave
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+QUESTIONS = [
+    ("technical", "Which backend frameworks have you used in production, and why?"),
+    ("technical", "How do you design a REST API that other teams depend on?"),
+    ("problem", "Tell me about a production outage you handled. What did you do?"),
+    ("problem", "How would you find the cause of a slow database query?"),
+    ("communication", "How do you explain a technical trade-off to a non-technical manager?"),
+    ("communication", "Describe a disagreement in your team and how it was resolved."),
+]
+
+ANSWER = (
+    "I have four years of experience with Django and Postgres. In production we "
+    "had a latency issue caused by a missing index, I debugged it and fixed it."
+)
+
+
+class LatencyModel:
+    """Log-normal latency around a median, plus an error rate."""
+
+    def __init__(self, median_ms=0, sigma=0.0, error_rate=0.0):
+        self.median_ms = median_ms
+        self.sigma = sigma
+        self.error_rate = error_rate
+
+    @classmethod
+    def parse(cls, spec):
+        # "median_ms[,sigma[,error_rate]]" e.g. "300,0.5,0.01"
+        parts = [float(p) for p in spec.split(",")] if spec else []
+        return cls(*parts)
+
+    def wait(self):
+        if self.median_ms > 0:
+            delay = random.lognormvariate(math.log(self.median_ms), self.sigma)
+            time.sleep(delay / 1000)
+        return random.random() >= self.error_rate
+
+
+@functools.lru_cache(maxsize=8)
+def tone_wav(seconds, rate=8000):
+    """Mono 16-bit WAV with a tone loud enough to pass the silence gate."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        frames = bytearray()
+        for i in range(int(seconds * rate)):
+            sample = int(8000 * math.sin(2 * math.pi * 220 * i / rate))
+            frames += sample.to_bytes(2, "little", signed=True)
+        wav.writeframes(bytes(frames))
+    return buffer.getvalue()
+
+
+def chat_content(body):
+    messages = body.get("messages", [])
+    system = messages[0]["content"] if messages else ""
+    prompt = messages[-1]["content"] if messages else ""
+
+    if "evaluation engine" in system:
+        count = len(re.findall(r"^Q\d+:", prompt, re.MULTILINE))
+        return json.dumps({"results": [
+            {
+                "question": f"Q{i}",
+                "communication": random.randint(5, 8),
+                "justification": random.randint(4, 8),
+                "confidence_without_content": False,
+                "scripted_sounding": False,
+                "reasoning": "Mentions real tools and a production issue."
+            }
+            for i in range(1, count + 1)
+        ]})
+
+    if "gathered enough information" in prompt:
+        return json.dumps({"end": random.random() < 0.3, "reason": "load test"})
+
+    intent, question = random.choice(QUESTIONS)
+    if "plain text" in prompt:
+        return f"{intent}\nThanks for that. {question}"
+
+    return json.dumps({"action": "ask", "intent": intent, "text": question})
+
+
+class FakeProviderHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "FakeProviders/1.0"
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, status, body, content_type):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def fail(self):
+        self.send_body(500, b'{"error": "injected failure"}', "application/json")
+
+    def do_GET(self):
+        # Twilio recordings: /recordings/<sid>.wav|.mp3
+        match = re.match(r"^/recordings/[\w-]+\.(wav|mp3)$", self.path)
+        if not match:
+            return self.send_body(404, b"", "text/plain")
+
+        if not self.server.twilio.wait():
+            return self.fail()
+
+        seconds = self.server.answer_seconds
+        if match.group(1) == "wav":
+            return self.send_body(200, tone_wav(seconds), "audio/wav")
+        # Roughly Twilio's MP3 size; content is never decoded by the fakes
+        return self.send_body(200, bytes(int(seconds * 4000)), "audio/mpeg")
+
+    def do_POST(self):
+        body = self.read_body()
+
+        if self.path.endswith("/chat/completions"):
+            return self.chat(json.loads(body or b"{}"))
+
+        if self.path.endswith("/audio/transcriptions"):
+            if not self.server.groq.wait():
+                return self.fail()
+            return self.send_body(200, json.dumps({"text": ANSWER}).encode(), "application/json")
+
+        if self.path.startswith("/v1/speech/stream"):
+            if not self.server.murf.wait():
+                return self.fail()
+            return self.send_body(200, bytes(6000), "audio/mpeg")
+
+        self.send_body(404, b"", "text/plain")
+
+    def chat(self, body):
+        if not self.server.groq.wait():
+            return self.fail()
+
+        content = chat_content(body)
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+
+        if not body.get("stream"):
+            return self.send_body(200, json.dumps({
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body.get("model"),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }],
+                "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+            }).encode(), "application/json")
+
+        # Server-sent events, a few characters per chunk
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        for i in range(0, len(content), 8):
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": body.get("model"),
+                "choices": [{"index": 0, "delta": {"content": content[i:i + 8]}, "finish_reason": None}],
+            }
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            self.wfile.flush()
+            time.sleep(self.server.token_delay)
+
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.close_connection = True
+
+
+def start_fake_providers(host="127.0.0.1", port=0, groq=None, murf=None, twilio=None,
+                         answer_seconds=20, token_delay=0.01):
+    """Starts the stand-ins in a background thread and returns the server."""
+    server = ThreadingHTTPServer((host, port), FakeProviderHandler)
+    server.daemon_threads = True
+    server.groq = groq or LatencyModel()
+    server.murf = murf or LatencyModel()
+    server.twilio = twilio or LatencyModel()
+    server.answer_seconds = answer_seconds
+    server.token_delay = token_delay
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def provider_env(server):
+    """Environment the web server under test needs to use the stand-ins."""
+    host, port = server.server_address[:2]
+    base = f"http://{host}:{port}"
+    return {
+        "GROQ_API_KEY": "fake",
+        "GROQ_BASE_URL": base,
+        "MURF_URL": f"{base}/v1/speech/stream",
+        "TWILIO_SID": "ACfake",
+        "TWILIO_AUTH": "fake",
+    }
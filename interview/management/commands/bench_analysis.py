@@ -0,0 +1,71 @@
+import json
+import os
+import timeit
+
+from django.core.management.base import BaseCommand, CommandError
+
+from interview.benchmarks.analysis import TURN_COUNTS, build_cases
+
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(__file__), "..", "..", "benchmarks", "baselines", "analysis.json"
+)
+
+
+def time_case(func, repeat):
+    """Best per-call time in microseconds."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+class Command(BaseCommand):
+    help = "Micro-benchmark the ai_analysis hot functions over 5-200 turn conversations."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+        parser.add_argument("--save-baseline", action="store_true")
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--threshold", type=float, default=20.0,
+            help="Percent slowdown against the baseline reported as a regression"
+        )
+        parser.add_argument("--fail-on-regression", action="store_true")
+
+    def handle(self, *args, **options):
+        results = {}
+        for turns in TURN_COUNTS:
+            for name, func in build_cases(turns).items():
+                results[f"{name}[{turns}]"] = time_case(func, options["repeat"])
+
+        baseline_path = os.path.normpath(options["baseline"])
+
+        if options["save_baseline"]:
+            os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+            with open(baseline_path, "w") as f:
+                json.dump(results, f, indent=2, sort_keys=True)
+            self.stdout.write(f"Baseline saved to {baseline_path}")
+
+        baseline = {}
+        if os.path.exists(baseline_path) and not options["save_baseline"]:
+            with open(baseline_path) as f:
+                baseline = json.load(f)
+
+        regressions = []
+        self.stdout.write(f"{'case':<45}{'us/call':>12}{'baseline':>12}{'change':>10}")
+
+        for key, value in results.items():
+            line = f"{key:<45}{value:>12.2f}"
+
+            if key in baseline:
+                change = (value - baseline[key]) / baseline[key] * 100
+                line += f"{baseline[key]:>12.2f}{change:>+9.1f}%"
+                if change > options["threshold"]:
+                    regressions.append(key)
+                    line += "  REGRESSION"
+
+            self.stdout.write(line)
+
+        if regressions:
+            self.stdout.write(f"{len(regressions)} regression(s) above {options['threshold']}%")
+            if options["fail_on_regression"]:
+                raise CommandError("Benchmark regressions: " + ", ".join(regressions))
@@ -0,0 +1,93 @@
+import os
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+
+from interview.services.speech_to_text import download_recording, transcribe_audio
+
+
+def word_error_rate(reference, hypothesis):
+    ref = reference.lower().split()
+    hyp = hypothesis.lower().split()
+    if not ref:
+        return 0.0 if not hyp else 1.0
+
+    row = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, start=1):
+        prev, row[0] = row[0], i
+        for j, h in enumerate(hyp, start=1):
+            prev, row[j] = row[j], min(
+                row[j] + 1,
+                row[j - 1] + 1,
+                prev + (r != h)
+            )
+
+    return row[-1] / len(ref)
+
+
+class Command(BaseCommand):
+    help = "Compare Twilio recording formats by transfer size, STT latency and transcript quality."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "recording_urls", nargs="+",
+            help="Twilio RecordingUrl values (without extension)"
+        )
+        parser.add_argument("--formats", default="wav,mp3")
+        parser.add_argument(
+            "--reference", default="wav",
+            help="Format whose transcript is the quality reference"
+        )
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def handle(self, *args, **options):
+        formats = options["formats"].split(",")
+        reference = options["reference"]
+        if reference not in formats:
+            formats.insert(0, reference)
+
+        os.makedirs("media/recordings", exist_ok=True)
+        totals = {fmt: {"bytes": 0, "download": 0.0, "stt": 0.0, "wer": 0.0} for fmt in formats}
+        runs = 0
+
+        for url in options["recording_urls"]:
+            for _ in range(options["repeat"]):
+                transcripts = {}
+                runs += 1
+
+                for fmt in formats:
+                    base = f"media/recordings/bench_{uuid.uuid4().hex}"
+
+                    start = time.perf_counter()
+                    path = download_recording(url, base, fmt)
+                    download_time = time.perf_counter() - start
+
+                    if not path:
+                        self.stderr.write(f"Download failed: {url} ({fmt})")
+                        continue
+
+                    size = os.path.getsize(path)
+                    start = time.perf_counter()
+                    transcripts[fmt] = transcribe_audio(path, source=url)
+                    stt_time = time.perf_counter() - start
+                    os.remove(path)
+
+                    totals[fmt]["bytes"] += size
+                    totals[fmt]["download"] += download_time
+                    totals[fmt]["stt"] += stt_time
+
+                for fmt, text in transcripts.items():
+                    totals[fmt]["wer"] += word_error_rate(
+                        transcripts.get(reference, ""), text
+                    )
+
+        self.stdout.write(
+            f"{'format':<8}{'avg KB':>10}{'download s':>12}{'stt s':>10}{'WER vs ' + reference:>14}"
+        )
+        for fmt, t in totals.items():
+            n = max(runs, 1)
+            self.stdout.write(
+                f"{fmt:<8}{t['bytes'] / n / 1024:>10.1f}{t['download'] / n:>12.3f}"
+                f"{t['stt'] / n:>10.3f}{t['wer'] / n:>14.3f}"
+            )
@@ -0,0 +1,141 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(__file__), "..", "..", "benchmarks", "baselines", "startup.json"
+)
+
+SETUP = "import os, django; os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings'); "
+
+# Each target runs in a fresh interpreter, measured from exec to exit
+TARGETS = {
+    "check": ["manage.py", "check"],
+    # WSGI app plus the URLconf, i.e. everything imported before the first request
+    "web": ["-c", SETUP + (
+        "from config.wsgi import application; "
+        "from django.urls import get_resolver; get_resolver().url_patterns"
+    )],
+    # Worker boot: app config plus task modules
+    "celery": ["-c", SETUP + (
+        "django.setup(); from config.celery import app; app.loader.import_default_modules()"
+    )],
+}
+
+
+def max_rss_mb(rusage):
+    # Linux reports KiB, macOS bytes
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return rusage.ru_maxrss / scale
+
+
+def run_target(args, importtime=False):
+    """Returns (seconds, max_rss_mb, returncode, stderr) for one cold start."""
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + args
+
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        command, cwd=settings.BASE_DIR,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    stderr = proc.stderr.read()
+    _, status, rusage = os.wait4(proc.pid, 0)
+    elapsed = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+
+    return elapsed, max_rss_mb(rusage), proc.returncode, stderr
+
+
+def slowest_imports(stderr, top):
+    """Parses `-X importtime` output into the `top` imports by cumulative time."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+class Command(BaseCommand):
+    help = "Measure cold-start time and peak RSS of manage.py check, the web worker and the Celery worker."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--targets", default=",".join(TARGETS))
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--importtime", type=int, default=0, metavar="N",
+            help="Also list the N slowest imports of each target"
+        )
+        parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+        parser.add_argument("--save-baseline", action="store_true")
+        parser.add_argument(
+            "--threshold", type=float, default=20.0,
+            help="Percent slowdown against the baseline reported as a regression"
+        )
+        parser.add_argument("--fail-on-regression", action="store_true")
+
+    def handle(self, *args, **options):
+        results = {}
+        self.stdout.write(f"{'target':<10}{'best s':>10}{'median s':>10}{'rss MB':>10}")
+
+        for name in options["targets"].split(","):
+            if name not in TARGETS:
+                raise CommandError(f"Unknown target {name}; choose from {', '.join(TARGETS)}")
+
+            runs = [run_target(TARGETS[name]) for _ in range(options["repeat"])]
+            failed = [r for r in runs if r[2] != 0]
+            if failed:
+                last_line = (failed[0][3].strip().splitlines() or ["no output"])[-1]
+                self.stdout.write(f"{name:<10}  failed: {last_line}")
+                continue
+
+            times = sorted(r[0] for r in runs)
+            rss = max(r[1] for r in runs)
+            results[name] = {"seconds": times[0], "rss_mb": rss}
+            self.stdout.write(
+                f"{name:<10}{times[0]:>10.3f}{times[len(times) // 2]:>10.3f}{rss:>10.1f}"
+            )
+
+            if options["importtime"]:
+                *_, stderr = run_target(TARGETS[name], importtime=True)
+                for cumulative, module in slowest_imports(stderr, options["importtime"]):
+                    self.stdout.write(f"    {cumulative / 1000:>8.1f} ms  {module}")
+
+        self.compare(results, options)
+
+    def compare(self, results, options):
+        baseline_path = os.path.normpath(options["baseline"])
+
+        if options["save_baseline"]:
+            os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+            with open(baseline_path, "w") as f:
+                json.dump(results, f, indent=2, sort_keys=True)
+            self.stdout.write(f"Baseline saved to {baseline_path}")
+            return
+
+        if not os.path.exists(baseline_path):
+            return
+
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+
+        regressions = []
+        for name, result in results.items():
+            if name not in baseline:
+                continue
+            for metric in ("seconds", "rss_mb"):
+                change = (result[metric] - baseline[name][metric]) / baseline[name][metric] * 100
+                self.stdout.write(f"{name}.{metric}: {change:+.1f}% vs baseline")
+                if change > options["threshold"]:
+                    regressions.append(f"{name}.{metric}")
+
+        if regressions:
+            self.stdout.write(f"{len(regressions)} regression(s) above {options['threshold']}%")
+            if options["fail_on_regression"]:
+                raise CommandError("Startup regressions: " + ", ".join(regressions))
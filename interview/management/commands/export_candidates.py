@@ -0,0 +1,39 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from interview.services.export import export_stream
+
+
+class Command(BaseCommand):
+    help = "Stream candidates, per-question scores and conversations as NDJSON or CSV."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+        parser.add_argument("--gzip", action="store_true")
+        parser.add_argument("--since", help="created_at >= (ISO date or datetime)")
+        parser.add_argument("--until", help="created_at < (ISO date or datetime)")
+        parser.add_argument("--decision")
+        parser.add_argument("--include-conversation", action="store_true")
+        parser.add_argument("--output", "-o", help="File to write (default stdout)")
+
+    def handle(self, *args, **options):
+        try:
+            chunks = export_stream(
+                fmt=options["format"],
+                gzip=options["gzip"],
+                since=options["since"],
+                until=options["until"],
+                decision=options["decision"],
+                include_conversation=options["include_conversation"],
+            )
+        except ValueError as e:
+            raise CommandError(e)
+
+        out = open(options["output"], "wb") if options["output"] else sys.stdout.buffer
+        try:
+            for chunk in chunks:
+                out.write(chunk.encode() if isinstance(chunk, str) else chunk)
+        finally:
+            if options["output"]:
+                out.close()
@@ -0,0 +1,39 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from interview.services.llm_usage import usage_by_day, usage_by_interview
+
+
+class Command(BaseCommand):
+    help = "Report LLM tokens, cost and latency per call site, by day or for one interview."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=7)
+        parser.add_argument("--candidate", type=int, help="Candidate id for a per-interview breakdown")
+
+    def handle(self, *args, **options):
+        if options["candidate"]:
+            rows = usage_by_interview(options["candidate"])
+            label = lambda row: row["site"]
+        else:
+            since = timezone.now() - timedelta(days=options["days"])
+            rows = usage_by_day(since)
+            label = lambda row: f"{row['day']} {row['site']}"
+
+        self.stdout.write(
+            f"{'site':<36}{'model':<26}{'reqs':>6}{'prompt':>10}{'compl':>9}{'avg ms':>8}{'usd':>10}"
+        )
+
+        total_cost = 0.0
+        for row in rows:
+            total_cost += row["cost"] or 0
+            self.stdout.write(
+                f"{label(row):<36}{row['model']:<26}{row['requests']:>6}"
+                f"{row['prompt'] or 0:>10}{row['completion'] or 0:>9}"
+                f"{(row['latency_total'] or 0) // row['requests']:>8}"
+                f"{row['cost'] or 0:>10.4f}"
+            )
+
+        self.stdout.write(f"Total cost: ${total_cost:.4f}")
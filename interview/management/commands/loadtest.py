@@ -0,0 +1,104 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from interview.loadtest.caller import SimulatedCall
+from interview.loadtest.fakes import LatencyModel, start_fake_providers, provider_env
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(int(round(pct / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+class Command(BaseCommand):
+    help = (
+        "Simulate N concurrent Twilio callers against /voice/ and report throughput "
+        "and turn latency. The server under test must use the fake providers "
+        "(run with --serve-only first and start the server with the printed env)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--target", default="http://127.0.0.1:8000")
+        parser.add_argument("--calls", type=int, default=20)
+        parser.add_argument("--concurrency", type=int, default=5)
+        parser.add_argument("--answer-seconds", type=float, default=20)
+        parser.add_argument("--max-turns", type=int, default=20)
+
+        parser.add_argument("--fakes-host", default="127.0.0.1")
+        parser.add_argument("--fakes-port", type=int, default=8099)
+        parser.add_argument(
+            "--fakes-url",
+            help="Use already running fake providers instead of starting them here"
+        )
+        parser.add_argument("--serve-only", action="store_true",
+                            help="Only run the fake providers until interrupted")
+
+        # "median_ms,sigma,error_rate"
+        parser.add_argument("--groq", default="300,0.4,0")
+        parser.add_argument("--murf", default="200,0.4,0")
+        parser.add_argument("--twilio", default="80,0.3,0")
+        parser.add_argument("--token-delay", type=float, default=0.01)
+
+    def handle(self, *args, **options):
+        fakes_url = options["fakes_url"]
+
+        if not fakes_url:
+            server = start_fake_providers(
+                host=options["fakes_host"],
+                port=options["fakes_port"],
+                groq=LatencyModel.parse(options["groq"]),
+                murf=LatencyModel.parse(options["murf"]),
+                twilio=LatencyModel.parse(options["twilio"]),
+                answer_seconds=options["answer_seconds"],
+                token_delay=options["token_delay"],
+            )
+            host, port = server.server_address[:2]
+            fakes_url = f"http://{host}:{port}"
+
+            self.stdout.write("Fake providers on " + fakes_url)
+            self.stdout.write("Start the server under test with:")
+            for key, value in provider_env(server).items():
+                self.stdout.write(f"  export {key}={value}")
+
+            if options["serve_only"]:
+                try:
+                    while True:
+                        time.sleep(3600)
+                except KeyboardInterrupt:
+                    return
+
+        os.makedirs("media/recordings", exist_ok=True)
+
+        calls = [
+            SimulatedCall(
+                options["target"], fakes_url,
+                answer_seconds=options["answer_seconds"],
+                max_turns=options["max_turns"],
+            )
+            for _ in range(options["calls"])
+        ]
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as pool:
+            list(pool.map(SimulatedCall.run, calls))
+        elapsed = time.perf_counter() - start
+
+        latencies = [l for c in calls for l in c.latencies]
+        errors = sum(c.errors for c in calls)
+        completed = sum(1 for c in calls if c.completed)
+
+        self.stdout.write(f"Calls:        {len(calls)} ({completed} completed) at concurrency {options['concurrency']}")
+        self.stdout.write(f"Duration:     {elapsed:.1f}s")
+        self.stdout.write(f"Throughput:   {len(latencies) / elapsed:.2f} turns/s, {completed / elapsed * 60:.1f} calls/min")
+        self.stdout.write(f"Errors:       {errors} of {len(latencies)} requests")
+        self.stdout.write(
+            f"Turn latency: p50 {percentile(latencies, 50) * 1000:.0f} ms, "
+            f"p95 {percentile(latencies, 95) * 1000:.0f} ms, "
+            f"p99 {percentile(latencies, 99) * 1000:.0f} ms"
+        )
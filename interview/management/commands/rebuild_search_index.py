@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from interview.models import AnswerDocument, Candidate
+from interview.services.search import answer_documents
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text answer index from stored conversations."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        AnswerDocument.objects.all().delete()
+
+        batch = []
+        total = 0
+        candidates = Candidate.objects.only("id", "conversation").order_by("id")
+
+        for candidate in candidates.iterator(chunk_size=options["batch_size"]):
+            batch.extend(answer_documents(candidate))
+
+            if len(batch) >= options["batch_size"]:
+                AnswerDocument.objects.bulk_create(batch)
+                total += len(batch)
+                batch = []
+
+        if batch:
+            AnswerDocument.objects.bulk_create(batch)
+            total += len(batch)
+
+        self.stdout.write(f"Indexed {total} answers")
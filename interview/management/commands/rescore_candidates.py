@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from interview.models import CallJob
+from interview.services.dialer import LIVE_STATUSES
+from interview.services.export import export_queryset
+from interview.tasks import rescore_candidates
+
+
+class Command(BaseCommand):
+    help = "Queue finished interviews for re-scoring on the bulk queue."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--since", help="created_at >= (ISO date or datetime)")
+        parser.add_argument("--until", help="created_at < (ISO date or datetime)")
+        parser.add_argument("--decision")
+        parser.add_argument("--batch-size", type=int, default=100)
+
+    def handle(self, *args, **options):
+        try:
+            queryset, _ = export_queryset(
+                since=options["since"],
+                until=options["until"],
+                decision=options["decision"],
+            )
+        except ValueError as e:
+            raise CommandError(e)
+        # Only finished interviews: never-called imports have no decision yet
+        # and calls in progress are scored when they end
+        queryset = queryset.exclude(decision="").exclude(
+            id__in=CallJob.objects.filter(status__in=LIVE_STATUSES).values("candidate_id")
+        )
+        ids = list(queryset.values_list("id", flat=True))
+
+        size = options["batch_size"]
+        for start in range(0, len(ids), size):
+            rescore_candidates.delay(ids[start:start + size])
+
+        self.stdout.write(f"Queued {len(ids)} candidate(s) in {-(-len(ids) // size)} task(s)")
@@ -0,0 +1,35 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from interview.models import Campaign
+from interview.services.admission import global_limit
+from interview.services.dialer import dispatch, release_stale
+
+
+class Command(BaseCommand):
+    help = "Dial queued campaign calls with pacing, concurrency caps and call windows."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Run a single dispatch pass")
+
+    def handle(self, *args, **options):
+        self.stdout.write("Dialer started")
+
+        while True:
+            release_stale()
+
+            placed = 0
+            # DIALER_MAX_CONCURRENT still caps the dialer under admission control
+            limit = min(global_limit(), settings.DIALER_MAX_CONCURRENT)
+            for campaign in Campaign.objects.filter(active=True):
+                placed += dispatch(campaign, limit)
+
+            if placed:
+                self.stdout.write(f"Placed {placed} call(s)")
+
+            if options["once"]:
+                return
+
+            time.sleep(settings.DIALER_TICK_SECONDS)
@@ -0,0 +1,32 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from config.celery import app
+
+
+class Command(BaseCommand):
+    help = "Start a Celery worker for one queue (live, scoring or bulk) with its concurrency and prefetch profile."
+
+    def add_arguments(self, parser):
+        parser.add_argument("queue", choices=list(settings.CELERY_QUEUE_WORKERS))
+        parser.add_argument("--concurrency", type=int, help="Override the queue's concurrency")
+        parser.add_argument("--loglevel", default="info")
+
+    def handle(self, *args, **options):
+        queue = options["queue"]
+        profile = settings.CELERY_QUEUE_WORKERS[queue]
+        concurrency = options["concurrency"] or profile["concurrency"]
+
+        self.stdout.write(
+            f"Worker for '{queue}': concurrency={concurrency}, "
+            f"prefetch_multiplier={profile['prefetch_multiplier']}"
+        )
+
+        app.worker_main([
+            "worker",
+            "--queues", queue,
+            "--hostname", f"{queue}@%h",
+            "--concurrency", str(concurrency),
+            "--prefetch-multiplier", str(profile["prefetch_multiplier"]),
+            "--loglevel", options["loglevel"],
+        ])
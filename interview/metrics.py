@@ -0,0 +1,143 @@
+# interview/metrics.py
+import os
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    REGISTRY,
+    generate_latest,
+    multiprocess,
+)
+
+from interview.tracing import span
+
+# Turn stages range from a few ms (TwiML) to tens of seconds (long STT)
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1, 2, 4, 8, 15, 30, 60,
+)
+
+STAGE_LATENCY = Histogram(
+    "interview_stage_seconds",
+    "Latency of one stage of a voice interview turn",
+    ["stage", "provider"],
+    buckets=LATENCY_BUCKETS,
+)
+
+STAGE_ERRORS = Counter(
+    "interview_stage_errors_total",
+    "Errors raised or swallowed in a turn stage",
+    ["stage", "provider"],
+)
+
+FALLBACKS = Counter(
+    "interview_fallbacks_total",
+    "Times a stage fell back to a degraded result",
+    ["stage", "reason"],
+)
+
+SCORE_CACHE = Counter(
+    "interview_score_cache_total",
+    "Per-question score cache lookups by result (hit, miss, audit)",
+    ["result"],
+)
+
+SCORE_CACHE_DRIFT = Histogram(
+    "interview_score_cache_drift",
+    "Largest score difference between an audited cache hit and the live score",
+    buckets=(0, 0.5, 1, 2, 3, 5, 10),
+)
+
+LLM_TOKENS = Counter(
+    "interview_llm_tokens_total",
+    "LLM tokens used, by call site and model",
+    ["site", "model", "kind"],
+)
+
+TASK_QUEUE_WAIT = Histogram(
+    "interview_task_queue_wait_seconds",
+    "Time a Celery task waited in its queue before a worker started it",
+    ["queue"],
+    buckets=LATENCY_BUCKETS,
+)
+
+TASK_RUNTIME = Histogram(
+    "interview_task_seconds",
+    "Run time of a Celery task on the worker",
+    ["queue", "task"],
+    buckets=LATENCY_BUCKETS,
+)
+
+
+@contextmanager
+def stage_timer(stage, provider="local"):
+    start = time.perf_counter()
+    try:
+        with span(stage, provider=provider):
+            yield
+    except Exception:
+        STAGE_ERRORS.labels(stage, provider).inc()
+        raise
+    finally:
+        STAGE_LATENCY.labels(stage, provider).observe(time.perf_counter() - start)
+
+
+def timed(stage, provider="local"):
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage_timer(stage, provider):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def record_error(stage, provider="local"):
+    STAGE_ERRORS.labels(stage, provider).inc()
+
+
+def record_fallback(stage, reason):
+    FALLBACKS.labels(stage, reason).inc()
+
+
+def render_metrics():
+    """Returns (body, content_type) for the /metrics endpoint."""
+    registry = REGISTRY
+
+    # Gunicorn / multi-worker deployments share samples through this dir
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def connect_celery():
+    """Publish timestamps on the producer; queue wait and run time on the worker."""
+    from celery.signals import before_task_publish, task_prerun, task_postrun
+
+    started = {}
+
+    @before_task_publish.connect(weak=False)
+    def stamp(headers=None, **kwargs):
+        if headers is not None:
+            headers["published_at"] = time.time()
+
+    @task_prerun.connect(weak=False)
+    def start(task_id=None, task=None, **kwargs):
+        queue = (task.request.delivery_info or {}).get("routing_key") or "unknown"
+        published_at = getattr(task.request, "published_at", None)
+        if published_at:
+            TASK_QUEUE_WAIT.labels(queue).observe(max(time.time() - published_at, 0))
+        started[task_id] = (queue, time.perf_counter())
+
+    @task_postrun.connect(weak=False)
+    def finish(task_id=None, task=None, **kwargs):
+        queue, start_time = started.pop(task_id, (None, None))
+        if start_time is not None:
+            TASK_RUNTIME.labels(queue, task.name).observe(time.perf_counter() - start_time)
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.10 on 2026-10-19 09:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0015_remove_candidate_awaiting_answer_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Campaign',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('active', models.BooleanField(default=True)),
+                ('calls_per_second', models.FloatField(default=1.0)),
+                ('max_concurrent', models.IntegerField(default=5)),
+                ('window_start', models.TimeField(blank=True, null=True)),
+                ('window_end', models.TimeField(blank=True, null=True)),
+                ('max_attempts', models.IntegerField(default=3)),
+                ('retry_delay_minutes', models.IntegerField(default=30)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CallJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('dialing', 'Dialing'), ('in_progress', 'In progress'), ('completed', 'Completed'), ('failed', 'Failed')], default='queued', max_length=20)),
+                ('attempts', models.IntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField(blank=True, null=True)),
+                ('call_sid', models.CharField(blank=True, db_index=True, max_length=64)),
+                ('last_result', models.CharField(blank=True, max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('campaign', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='jobs', to='interview.campaign')),
+                ('candidate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='call_jobs', to='interview.candidate')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'next_attempt_at'], name='calljob_status_next_idx')],
+            },
+        ),
+    ]
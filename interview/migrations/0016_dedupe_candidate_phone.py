@@ -0,0 +1,76 @@
+from django.db import migrations, models
+from django.db.models import Count
+
+ARCHIVED_FIELDS = (
+    "conversation", "questions_asked", "final_score", "decision", "hr_summary", "red_flags",
+)
+
+
+def survivor_rank(candidate):
+    # Prefer a scored interview, then the longest conversation, then the newest row
+    return (bool(candidate.decision), len(candidate.conversation or []), candidate.id)
+
+
+def dedupe_candidate_phone(apps, schema_editor):
+    """
+    Before 0017 every call created its own candidate row, so a phone can
+    appear more than once. Keeps the most complete row per phone, moves
+    the call jobs of the others onto it and archives their interviews in
+    its previous_interviews.
+    """
+    Candidate = apps.get_model("interview", "Candidate")
+    CallJob = apps.get_model("interview", "CallJob")
+
+    duplicated = (
+        Candidate.objects.values("phone")
+        .annotate(rows=Count("id"))
+        .filter(rows__gt=1)
+        .values_list("phone", flat=True)
+    )
+    for phone in list(duplicated):
+        rows = sorted(Candidate.objects.filter(phone=phone), key=survivor_rank, reverse=True)
+        keep, others = rows[0], rows[1:]
+
+        keep.previous_interviews = [
+            {
+                "id": other.id,
+                "created_at": other.created_at.isoformat(),
+                **{field: getattr(other, field) for field in ARCHIVED_FIELDS},
+            }
+            for other in sorted(others, key=lambda c: c.id)
+        ]
+        keep.save(update_fields=["previous_interviews"])
+
+        CallJob.objects.filter(candidate__in=others).update(candidate=keep)
+        Candidate.objects.filter(id__in=[other.id for other in others]).delete()
+
+
+def restore_candidate_phone(apps, schema_editor):
+    """Recreates the archived rows under their original ids."""
+    Candidate = apps.get_model("interview", "Candidate")
+
+    for keep in Candidate.objects.exclude(previous_interviews=[]):
+        for archived in keep.previous_interviews:
+            Candidate.objects.create(
+                id=archived["id"],
+                phone=keep.phone,
+                **{field: archived[field] for field in ARCHIVED_FIELDS},
+            )
+            # auto_now_add ignores a passed value
+            Candidate.objects.filter(id=archived["id"]).update(created_at=archived["created_at"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0016_campaign_calljob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidate',
+            name='previous_interviews',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.RunPython(dedupe_candidate_phone, restore_candidate_phone),
+    ]
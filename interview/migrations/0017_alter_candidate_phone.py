@@ -0,0 +1,18 @@
+# Generated by Django 5.2.10 on 2026-10-19 10:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0016_dedupe_candidate_phone'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='candidate',
+            name='phone',
+            field=models.CharField(max_length=20, unique=True),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.10 on 2026-10-19 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0017_alter_candidate_phone'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='candidate',
+            index=models.Index(fields=['decision'], name='candidate_decision_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidate',
+            index=models.Index(fields=['final_score'], name='candidate_score_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='candidate',
+            index=models.Index(fields=['created_at'], name='candidate_created_idx'),
+        ),
+    ]
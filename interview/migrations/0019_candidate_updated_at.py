@@ -0,0 +1,24 @@
+# Generated by Django 5.2.10 on 2026-10-19 12:15
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0018_candidate_admin_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidate',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='candidate',
+            index=models.Index(fields=['updated_at', 'id'], name='candidate_updated_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.10 on 2026-10-19 12:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0019_candidate_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidate',
+            name='question_scores',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
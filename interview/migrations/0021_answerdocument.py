@@ -0,0 +1,96 @@
+# Generated by Django 5.2.10 on 2026-10-19 13:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+SQLITE_FORWARD = [
+    """
+    CREATE VIRTUAL TABLE interview_answer_fts USING fts5(
+        question, answer,
+        content='interview_answerdocument', content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER interview_answer_fts_ai AFTER INSERT ON interview_answerdocument BEGIN
+        INSERT INTO interview_answer_fts(rowid, question, answer)
+        VALUES (new.id, new.question, new.answer);
+    END
+    """,
+    """
+    CREATE TRIGGER interview_answer_fts_ad AFTER DELETE ON interview_answerdocument BEGIN
+        INSERT INTO interview_answer_fts(interview_answer_fts, rowid, question, answer)
+        VALUES ('delete', old.id, old.question, old.answer);
+    END
+    """,
+    """
+    CREATE TRIGGER interview_answer_fts_au AFTER UPDATE ON interview_answerdocument BEGIN
+        INSERT INTO interview_answer_fts(interview_answer_fts, rowid, question, answer)
+        VALUES ('delete', old.id, old.question, old.answer);
+        INSERT INTO interview_answer_fts(rowid, question, answer)
+        VALUES (new.id, new.question, new.answer);
+    END
+    """,
+]
+
+SQLITE_REVERSE = [
+    "DROP TRIGGER IF EXISTS interview_answer_fts_au",
+    "DROP TRIGGER IF EXISTS interview_answer_fts_ad",
+    "DROP TRIGGER IF EXISTS interview_answer_fts_ai",
+    "DROP TABLE IF EXISTS interview_answer_fts",
+]
+
+POSTGRES_FORWARD = [
+    """
+    ALTER TABLE interview_answerdocument ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(answer, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(question, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX interview_answer_search_idx ON interview_answerdocument USING GIN (search_vector)",
+]
+
+POSTGRES_REVERSE = [
+    "DROP INDEX IF EXISTS interview_answer_search_idx",
+    "ALTER TABLE interview_answerdocument DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def run_statements(forward):
+    def run(apps, schema_editor):
+        vendor = schema_editor.connection.vendor
+        if vendor == "sqlite":
+            statements = SQLITE_FORWARD if forward else SQLITE_REVERSE
+        elif vendor == "postgresql":
+            statements = POSTGRES_FORWARD if forward else POSTGRES_REVERSE
+        else:
+            return
+        for sql in statements:
+            schema_editor.execute(sql)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0020_candidate_question_scores'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnswerDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('turn_index', models.IntegerField()),
+                ('question', models.TextField(blank=True)),
+                ('answer', models.TextField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('candidate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='answer_documents', to='interview.candidate')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('candidate', 'turn_index'), name='answerdoc_candidate_turn_uniq')],
+            },
+        ),
+        migrations.RunPython(run_statements(True), run_statements(False)),
+    ]
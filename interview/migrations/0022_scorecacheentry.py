@@ -0,0 +1,28 @@
+# Generated by Django 5.2.10 on 2026-10-19 13:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0021_answerdocument'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScoreCacheEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('question_key', models.CharField(db_index=True, max_length=40)),
+                ('question', models.TextField()),
+                ('answer', models.TextField()),
+                ('vector', models.BinaryField()),
+                ('communication', models.FloatField()),
+                ('justification', models.FloatField()),
+                ('reasoning', models.TextField(blank=True)),
+                ('hits', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.10 on 2026-10-19 14:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0022_scorecacheentry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='candidate',
+            name='pending_turn',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
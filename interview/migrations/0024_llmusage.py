@@ -0,0 +1,32 @@
+# Generated by Django 5.2.10 on 2026-10-19 15:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('interview', '0023_candidate_pending_turn'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LLMUsage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('call_sid', models.CharField(blank=True, max_length=64)),
+                ('site', models.CharField(max_length=40)),
+                ('model', models.CharField(max_length=60)),
+                ('prompt_tokens', models.IntegerField(default=0)),
+                ('completion_tokens', models.IntegerField(default=0)),
+                ('latency_ms', models.IntegerField(default=0)),
+                ('cost_usd', models.FloatField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('candidate', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='llm_usage', to='interview.candidate')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['candidate', 'site'], name='llmusage_candidate_site_idx'), models.Index(fields=['created_at'], name='llmusage_created_idx')],
+            },
+        ),
+    ]
@@ -1,7 +1,7 @@
 from django.db import models
 
 class Candidate(models.Model):
-    phone = models.CharField(max_length=20)
+    phone = models.CharField(max_length=20, unique=True)
     conversation = models.JSONField(default=list, blank=True)
     questions_asked = models.IntegerField(default=0)
 
@@ -9,5 +9,144 @@ class Candidate(models.Model):
     decision = models.CharField(max_length=20, blank=True)
     red_flags = models.JSONField(default=list, blank=True)
     hr_summary = models.TextField(blank=True)
+    question_scores = models.JSONField(default=list, blank=True)
 
+    # Interviews of the same phone from before phones were unique (0016)
+    previous_interviews = models.JSONField(default=list, blank=True)
+
+    # Turn being prepared on the live queue (TURN_ASYNC), see /voice/turn/
+    pending_turn = models.JSONField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        # Admin changelist filters and sorts
+        indexes = [
+            models.Index(fields=["decision"], name="candidate_decision_idx"),
+            models.Index(fields=["final_score"], name="candidate_score_idx"),
+            models.Index(fields=["created_at"], name="candidate_created_idx"),
+            # API incremental sync (updated_since + cursor order)
+            models.Index(fields=["updated_at", "id"], name="candidate_updated_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        # auto_now is skipped by save(update_fields=...) unless listed
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "updated_at" not in update_fields:
+            kwargs["update_fields"] = [*update_fields, "updated_at"]
+        super().save(*args, **kwargs)
+
+
+class Campaign(models.Model):
+    name = models.CharField(max_length=100)
+    active = models.BooleanField(default=True)
+
+    # Pacing and capacity
+    calls_per_second = models.FloatField(default=1.0)
+    max_concurrent = models.IntegerField(default=5)
+
+    # Local time window in which calls may be placed (blank = any time)
+    window_start = models.TimeField(null=True, blank=True)
+    window_end = models.TimeField(null=True, blank=True)
+
+    # Retry on busy / no-answer
+    max_attempts = models.IntegerField(default=3)
+    retry_delay_minutes = models.IntegerField(default=30)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.name
+
+
+class CallJob(models.Model):
+    QUEUED = "queued"
+    DIALING = "dialing"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+    STATUS_CHOICES = [
+        (QUEUED, "Queued"),
+        (DIALING, "Dialing"),
+        (IN_PROGRESS, "In progress"),
+        (COMPLETED, "Completed"),
+        (FAILED, "Failed"),
+    ]
+
+    campaign = models.ForeignKey(Campaign, on_delete=models.CASCADE, related_name="jobs")
+    candidate = models.ForeignKey(Candidate, on_delete=models.CASCADE, related_name="call_jobs")
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=QUEUED)
+    attempts = models.IntegerField(default=0)
+    next_attempt_at = models.DateTimeField(null=True, blank=True)
+    call_sid = models.CharField(max_length=64, blank=True, db_index=True)
+    last_result = models.CharField(max_length=20, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"], name="calljob_status_next_idx"),
+        ]
+
+
+class AnswerDocument(models.Model):
+    """
+    One candidate answer with the question it replied to, kept in a
+    full-text index (SQLite FTS5 or a Postgres tsvector, see migration 0021).
+    """
+    candidate = models.ForeignKey(Candidate, on_delete=models.CASCADE, related_name="answer_documents")
+    turn_index = models.IntegerField()
+    question = models.TextField(blank=True)
+    answer = models.TextField()
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["candidate", "turn_index"], name="answerdoc_candidate_turn_uniq"),
+        ]
+
+
+class ScoreCacheEntry(models.Model):
+    """
+    LLM scores of one answer, reused for later answers to the same question
+    that are close enough (see interview/services/score_cache.py).
+    """
+    question_key = models.CharField(max_length=40, db_index=True)
+    question = models.TextField()
+    answer = models.TextField()
+    vector = models.BinaryField()
+
+    communication = models.FloatField()
+    justification = models.FloatField()
+    reasoning = models.TextField(blank=True)
+
+    hits = models.IntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
+
+
+class LLMUsage(models.Model):
+    """Tokens, latency and cost of one LLM request, by call site."""
+    candidate = models.ForeignKey(
+        Candidate, on_delete=models.SET_NULL, null=True, blank=True, related_name="llm_usage"
+    )
+    call_sid = models.CharField(max_length=64, blank=True)
+    site = models.CharField(max_length=40)
+    model = models.CharField(max_length=60)
+
+    prompt_tokens = models.IntegerField(default=0)
+    completion_tokens = models.IntegerField(default=0)
+    latency_ms = models.IntegerField(default=0)
+    cost_usd = models.FloatField(default=0)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["candidate", "site"], name="llmusage_candidate_site_idx"),
+            models.Index(fields=["created_at"], name="llmusage_created_idx"),
+        ]
@@ -0,0 +1,155 @@
+# interview/profiling.py
+"""
+Per-call profiling, off unless a request is sampled.
+
+A call is profiled when any of these holds:
+- random sampling at PROFILE_SAMPLE_RATE
+- its CallSid is in PROFILE_CALL_SIDS
+- the request carries X-Profile: <PROFILE_HEADER_TOKEN>
+
+Output (cProfile stats or folded stacks, plus an allocation summary) is
+written to PROFILE_DIR.
+"""
+import cProfile
+import io
+import logging
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from functools import wraps
+
+from django.conf import settings
+
+from interview import tracing
+
+logger = logging.getLogger(__name__)
+
+# tracemalloc is process-wide; only one sampled request traces at a time
+_alloc_lock = threading.Lock()
+
+
+def should_profile(request=None):
+    call_sid = tracing.current().get("call_sid")
+    if request is not None:
+        call_sid = request.POST.get("CallSid") or call_sid
+
+        token = settings.PROFILE_HEADER_TOKEN
+        if token and request.META.get("HTTP_X_PROFILE") == token:
+            return True
+
+    if call_sid and call_sid in settings.PROFILE_CALL_SIDS:
+        return True
+
+    rate = settings.PROFILE_SAMPLE_RATE
+    return rate > 0 and random.random() < rate
+
+
+class StackSampler:
+    """Samples one thread's stack every interval; output is folded stacks."""
+
+    def __init__(self, thread_id, interval=0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def folded(self):
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common())
+
+
+def allocation_summary(snapshot, limit=25):
+    stats = snapshot.statistics("lineno")
+    total = sum(stat.size for stat in stats)
+    lines = [f"Total allocated and still live: {total / 1024:.1f} KiB"]
+    lines += [str(stat) for stat in stats[:limit]]
+    return "\n".join(lines)
+
+
+def output_base(name):
+    os.makedirs(settings.PROFILE_DIR, exist_ok=True)
+    call_sid = tracing.current().get("call_sid") or "nocall"
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    return os.path.join(str(settings.PROFILE_DIR), f"{stamp}_{name}_{call_sid}_{os.getpid()}")
+
+
+def run_profiled(name, func, args, kwargs):
+    tracing_allocs = _alloc_lock.acquire(blocking=False)
+    if tracing_allocs:
+        tracemalloc.start()
+
+    if settings.PROFILE_MODE == "sampling":
+        profiler = StackSampler(threading.get_ident())
+        profiler.start()
+    else:
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    start = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        elapsed = time.perf_counter() - start
+        base = output_base(name)
+
+        if isinstance(profiler, StackSampler):
+            profiler.stop()
+            with open(f"{base}.folded", "w") as f:
+                f.write(profiler.folded())
+            summary = f"Stack samples written to {base}.folded"
+        else:
+            profiler.disable()
+            profiler.dump_stats(f"{base}.prof")
+            out = io.StringIO()
+            pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(40)
+            summary = out.getvalue()
+
+        if tracing_allocs:
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            _alloc_lock.release()
+            summary += "\n\n" + allocation_summary(snapshot)
+
+        with open(f"{base}.txt", "w") as f:
+            f.write(f"{name} took {elapsed * 1000:.1f} ms\n\n{summary}")
+
+        logger.info("Profile written", extra={"profile": base, "elapsed_ms": round(elapsed * 1000, 1)})
+
+
+def profiled(name):
+    """
+    Profiles sampled calls of a view or task. For views the request's
+    CallSid and X-Profile header take part in the sampling decision.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            request = args[0] if args and hasattr(args[0], "META") else None
+            if not should_profile(request):
+                return func(*args, **kwargs)
+            return run_profiled(name, func, args, kwargs)
+        return wrapper
+    return decorator
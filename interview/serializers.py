@@ -0,0 +1,70 @@
+from rest_framework import serializers
+
+from interview.models import Candidate
+
+
+class SparseFieldsetSerializer(serializers.ModelSerializer):
+    """
+    ?fields=a,b limits the response to those fields; fields listed in
+    Meta.heavy_fields (e.g. the transcript) are only sent when named in
+    ?fields= or ?include=.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get("request")
+        if request is None:
+            return
+
+        wanted = selected_fields(self.__class__, request.query_params)
+        for name in list(self.fields):
+            if name not in wanted:
+                self.fields.pop(name)
+
+
+def split_param(params, name):
+    return {f.strip() for f in params.get(name, "").split(",") if f.strip()}
+
+
+def selected_fields(serializer_class, params):
+    meta = serializer_class.Meta
+    heavy = set(getattr(meta, "heavy_fields", ()))
+    requested = split_param(params, "fields")
+
+    if requested:
+        return (requested & set(meta.fields)) | {"id"}
+    return (set(meta.fields) - heavy) | (split_param(params, "include") & heavy)
+
+
+class CandidateSerializer(SparseFieldsetSerializer):
+    class Meta:
+        model = Candidate
+        fields = [
+            "id",
+            "phone",
+            "questions_asked",
+            "final_score",
+            "decision",
+            "created_at",
+            "updated_at",
+            "conversation",
+        ]
+        heavy_fields = ["conversation"]
+
+
+class ResultSerializer(SparseFieldsetSerializer):
+    class Meta:
+        model = Candidate
+        fields = [
+            "id",
+            "phone",
+            "final_score",
+            "decision",
+            "red_flags",
+            "hr_summary",
+            "question_scores",
+            "questions_asked",
+            "updated_at",
+            "conversation",
+        ]
+        heavy_fields = ["conversation", "hr_summary", "question_scores"]
@@ -47,9 +47,15 @@
 
 
 # interview/services/TTS_genrater.py
-import os, hashlib, requests
+import os, hashlib, logging, requests
 
-MURF_URL = "https://global.api.murf.ai/v1/speech/stream"
+from interview.metrics import timed, record_error
+from interview.services import provider_health
+from interview.services.cassette import cassette, dump_audio_file, load_audio_file
+
+logger = logging.getLogger(__name__)
+
+MURF_URL = os.getenv("MURF_URL", "https://global.api.murf.ai/v1/speech/stream")
 MURF_API_KEY = os.getenv("MURF_API_KEY")
 
 HEADERS = {
@@ -57,6 +63,8 @@ HEADERS = {
     "Content-Type": "application/json"
 }
 
+@timed("tts", "murf")
+@cassette("murf_tts", dump=dump_audio_file, load=load_audio_file)
 def murf_tts(text: str) -> str:
     text = text.strip()
     if not text:
@@ -76,16 +84,19 @@ def murf_tts(text: str) -> str:
         "format": "MP3"
     }
 
-    r = requests.post(
-        MURF_URL,
-        headers=HEADERS,
-        json=payload,
-        stream=True,
-        timeout=20
-    )
+    with provider_health.measure("murf") as probe:
+        r = requests.post(
+            MURF_URL,
+            headers=HEADERS,
+            json=payload,
+            stream=True,
+            timeout=20
+        )
+        probe.failed = r.status_code != 200
 
     if r.status_code != 200:
-        print("❌ Murf error:", r.status_code, r.text)
+        logger.error("Murf error", extra={"status_code": r.status_code, "body": r.text})
+        record_error("tts", "murf")
         raise RuntimeError("Murf TTS failed")
 
     with open(out_path, "wb") as f:
@@ -0,0 +1,80 @@
+# interview/services/admission.py
+"""
+Admission control for live interviews.
+
+A new call is placed only while the number of live interviews is under
+ADMISSION_MAX_LIVE and no live-turn provider is over its latency SLO.
+Otherwise it waits as a queued CallJob and the dialer places it once
+capacity comes back, so calls already in progress keep their latency.
+"""
+import logging
+
+from django.conf import settings
+
+from interview.metrics import record_fallback
+from interview.models import Campaign, Candidate, CallJob
+from interview.services.dialer import LIVE_STATUSES, OPEN_STATUSES, claim_next, dial
+from interview.services.provider_health import degraded_providers
+
+logger = logging.getLogger(__name__)
+
+MANUAL_CAMPAIGN = "Manual calls"
+
+# Outcomes of request_call
+PLACED = "placed"
+QUEUED = "queued"
+FAILED = "failed"
+IN_CALL = "in_call"
+
+
+def global_limit():
+    """Live interviews allowed right now; 0 pauses all new dials."""
+    degraded = degraded_providers()
+    if degraded:
+        logger.warning("Admission paused", extra={"degraded_providers": degraded})
+        return 0
+    return settings.ADMISSION_MAX_LIVE
+
+
+def manual_campaign():
+    campaign, _ = Campaign.objects.get_or_create(
+        name=MANUAL_CAMPAIGN,
+        defaults={"max_concurrent": settings.ADMISSION_MAX_LIVE},
+    )
+    return campaign
+
+
+def request_call(phone):
+    """
+    Places a call now if it is admitted, otherwise queues it for the dialer.
+    Returns PLACED, QUEUED, FAILED (Twilio refused the call; the job is
+    retried like any campaign call while attempts remain) or IN_CALL (the
+    candidate is already being called).
+
+    A candidate's open job is reused, so repeated submits never queue a
+    second call to the same phone.
+    """
+    candidate, _ = Candidate.objects.get_or_create(phone=phone)
+
+    job = (
+        candidate.call_jobs.filter(status__in=OPEN_STATUSES)
+        .select_related("campaign")
+        .order_by("id")
+        .first()
+    )
+    if job is None:
+        job = CallJob.objects.create(campaign=manual_campaign(), candidate=candidate)
+    elif job.status in LIVE_STATUSES:
+        return IN_CALL
+    elif job.next_attempt_at is not None:
+        # Asked for now, so a pending retry backoff no longer applies
+        CallJob.objects.filter(id=job.id).update(next_attempt_at=None)
+
+    # Claimed under the same lock as the dialer's, so both see one count
+    job = claim_next(job.campaign, global_limit(), candidate=candidate)
+    if job is not None:
+        dial(job)
+        return PLACED if job.status == CallJob.DIALING else FAILED
+
+    record_fallback("admission", "queued")
+    return QUEUED
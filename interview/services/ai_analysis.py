@@ -1,29 +1,50 @@
+import itertools
 import json
+import logging
 import re
-from groq import Groq
+import time
+from functools import lru_cache
 from config import settings
+from interview.metrics import stage_timer, timed, record_error, record_fallback
+from interview.tracing import span
+from interview.services.cassette import cassette
+from interview.profiling import profiled
+from interview.services import llm_usage, provider_health, score_cache
 
-client = Groq(api_key=settings.GROQ_API_KEY)
-# client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def get_client():
+    # Built on first use so imports and management commands skip the SDK
+    from groq import Groq
+    return Groq(api_key=settings.GROQ_API_KEY, base_url=settings.GROQ_BASE_URL)
+
+
+@cassette("call_groq")
 def call_groq(prompt, temperature=0.2, max_tokens=800):
+    site = llm_usage.current_site()
+    model = llm_usage.choose_model(site)
+
     try:
-        response = client.chat.completions.create(
-            model="llama-3.1-8b-instant",  
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a strict, professional HR interviewer."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
+        start = time.perf_counter()
+        with span("groq.chat", site=site, model=model), provider_health.measure("groq"):
+            response = get_client().chat.completions.create(
+                model=model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are a strict, professional HR interviewer."
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
+        llm_usage.record(site, model, response.usage, time.perf_counter() - start)
 
         content = response.choices[0].message.content.strip()
 
@@ -34,9 +55,80 @@ def call_groq(prompt, temperature=0.2, max_tokens=800):
             return {"text": content}
 
     except Exception as e:
-        print("❌ Groq error:", e)
+        logger.error("Groq error: %s", e)
+        record_error("call_groq", "groq")
         return {}
-    
+
+
+@cassette("stream_groq", stream=True)
+def stream_groq(prompt, temperature=0.2, max_tokens=800):
+    """Yields completion tokens as Groq produces them."""
+    # Read here: the tail of the stream is consumed on a pipeline thread
+    site = llm_usage.current_site()
+    model = llm_usage.choose_model(site)
+
+    try:
+        start = time.perf_counter()
+        # Measures until the response starts streaming, i.e. first-token latency
+        with provider_health.measure("groq"):
+            stream = get_client().chat.completions.create(
+                model=model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are a strict, professional HR interviewer."
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True
+            )
+
+        usage = None
+        for chunk in stream:
+            # Groq reports usage on the last chunk
+            x_groq = getattr(chunk, "x_groq", None)
+            usage = getattr(chunk, "usage", None) or getattr(x_groq, "usage", None) or usage
+
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+
+        llm_usage.record(site, model, usage, time.perf_counter() - start)
+
+    except Exception as e:
+        logger.error("Groq stream error: %s", e)
+        record_error("stream_groq", "groq")
+
+
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+
+def stream_sentences(tokens):
+    """Cuts a token stream into complete sentences as soon as they close."""
+    buffer = ""
+
+    for token in tokens:
+        buffer += token
+        parts = SENTENCE_BOUNDARY.split(buffer)
+
+        for sentence in parts[:-1]:
+            if sentence.strip():
+                yield sentence.strip()
+
+        buffer = parts[-1]
+
+    if buffer.strip():
+        yield buffer.strip()
+
+
+@timed("should_end_interview", "groq")
 def should_end_interview(conversation):
     candidate_answers = [
         m["text"].lower()
@@ -84,7 +176,8 @@ Answer strictly as JSON:
 }}
 """
 
-    ai = call_groq(prompt)   # you already have this
+    with llm_usage.call_site("should_end_interview"):
+        ai = call_groq(prompt)   # you already have this
     return ai.get("end", False), ai.get("reason", "")
 
 
@@ -120,7 +213,82 @@ Respond ONLY in JSON:
 }}
 """
 
-    return call_groq(prompt)
+    with stage_timer("generate_ai_turn", "groq"), llm_usage.call_site("generate_ai_turn"):
+        return call_groq(prompt)
+
+
+def regenerate_question(conversation, asked):
+    """Asks again after the model repeated one of the `asked` questions."""
+    already_asked = "\n".join(f"- {q}" for q in asked)
+
+    prompt = f"""
+You are a professional HR interviewer on a phone call.
+
+These questions were ALREADY asked. Ask something different that covers
+a new topic, and do not rephrase any of them:
+{already_asked}
+
+Conversation so far:
+{conversation}
+
+Respond ONLY in JSON:
+{{
+  "intent": "intro|technical|problem|communication",
+  "text": "question to ask"
+}}
+"""
+
+    with stage_timer("regenerate_question", "groq"), llm_usage.call_site("regenerate_question"):
+        return call_groq(prompt, temperature=0.7)
+
+
+QUESTION_INTENTS = ("intro", "technical", "problem", "communication")
+
+
+def stream_ai_question(conversation):
+    """
+    Streaming variant of generate_ai_turn for the question text only.
+    The end-of-interview decision is left to the caller.
+
+    Returns (intent, sentences) where sentences is a generator that yields
+    each sentence of the question while the rest is still being generated.
+    """
+    prompt = f"""
+You are a professional HR interviewer on a phone call.
+
+Rules:
+- Ask ONE clear question
+- Adapt based on candidate's last answer
+- If candidate is junior, simplify
+- If experienced, go deeper
+- Do NOT repeat questions
+- Be natural and concise
+
+Conversation so far:
+{conversation}
+
+Respond in plain text, NOT JSON:
+- First line: the intent only (intro|technical|problem|communication)
+- Next line: the question to ask, exactly as it should be spoken
+"""
+
+    tokens = stream_groq(prompt)
+
+    head = ""
+    with stage_timer("generate_ai_turn", "groq_stream"), llm_usage.call_site("generate_ai_turn"):
+        for token in tokens:
+            head += token
+            if "\n" in head:
+                break
+
+    intent, _, rest = head.partition("\n")
+    intent = intent.strip().strip("[]:*").lower()
+
+    # Model skipped the intent line; everything read so far is question text
+    if intent not in QUESTION_INTENTS:
+        intent, rest = "general", head
+
+    return intent, stream_sentences(itertools.chain([rest], tokens))
 
 
 def local_invalid_check(answer: str) -> dict:
@@ -362,6 +530,7 @@ def safe_json_extract(text):
     return None
 
 
+@cassette("groq_score_full_interview")
 def groq_score_full_interview(questions_with_answers):
 
     formatted_qa = ""
@@ -478,35 +647,34 @@ IMPORTANT:
 """
 
 
-    response = client.chat.completions.create(
-        model="llama-3.1-8b-instant",
-        messages=[
-            {"role": "system", "content": "You are an HR evaluation engine."},
-            {"role": "user", "content": prompt}
-        ],
-        temperature=0.1,
-        max_tokens=1500
-    )
+    model = llm_usage.choose_model("scoring")
+
+    start = time.perf_counter()
+    with span("groq.score", questions=len(questions_with_answers), model=model):
+        response = get_client().chat.completions.create(
+            model=model,
+            messages=[
+                {"role": "system", "content": "You are an HR evaluation engine."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.1,
+            max_tokens=1500
+        )
+    llm_usage.record("scoring", model, response.usage, time.perf_counter() - start)
 
     content = response.choices[0].message.content.strip()
 
     parsed = safe_json_extract(content)
 
     if not parsed:
-        print("❌ Groq JSON parse failed. Raw output:\n", content)
+        logger.error("Groq JSON parse failed", extra={"raw_output": content})
+        record_error("scoring_parse", "groq")
         return {"results": []}
 
     return parsed
 
 
-def evaluate_full_interview_from_conversation(conversation):
-    print("\n========== FULL CONVERSATION ==========")
-    for turn in conversation:
-        role = turn.get("role", "").upper()
-        text = turn.get("text", "")
-        print(f"{role}: {text}")
-    print("=======================================\n")
-
+def pair_questions_and_answers(conversation):
     qa_pairs = []
     last_question = None
 
@@ -525,8 +693,24 @@ def evaluate_full_interview_from_conversation(conversation):
             })
             last_question = None
 
+    return qa_pairs
+
+
+@profiled("scoring")
+@timed("scoring", "groq")
+def evaluate_full_interview_from_conversation(conversation, use_cache=True):
+    """
+    use_cache=False scores every answer live and leaves the score cache
+    untouched, e.g. for re-scores, whose answers are already cached.
+    """
+    # Whole transcripts only when debugging; the listener thread writes them
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Full conversation", extra={"conversation": conversation})
+
+    qa_pairs = pair_questions_and_answers(conversation)
+
     if not qa_pairs:
-        print("❌ No valid Q/A pairs found")
+        logger.warning("No valid Q/A pairs found")
         return {
             "final_score": 0,
             "decision": "REJECT",
@@ -543,7 +727,8 @@ def evaluate_full_interview_from_conversation(conversation):
         valid_items.append({
             "question": pair["question"],
             "answer": pair["answer"],
-            "force_zero": not check["valid"]
+            "force_zero": not check["valid"],
+            "reason": check["reason"]
         })
 
         if not check["valid"]:
@@ -551,8 +736,41 @@ def evaluate_full_interview_from_conversation(conversation):
                 f"Question {idx}: {check['reason']}"
             )
 
-    groq_result = groq_score_full_interview(valid_items)
-    results = groq_result.get("results", [])
+    # Reuse scores of near-identical earlier answers; only the rest go to the LLM
+    cached = {}
+    audits = {}
+    to_score = []
+
+    for idx, item in enumerate(valid_items):
+        if item["force_zero"]:
+            continue
+
+        scores, audit_entry = None, None
+        if use_cache:
+            scores, audit_entry = score_cache.cached_scores(item["question"], item["answer"])
+
+        if scores is not None:
+            cached[idx] = scores
+            continue
+
+        if audit_entry is not None:
+            audits[idx] = audit_entry
+        to_score.append(idx)
+
+    results = {}
+    if to_score:
+        groq_result = groq_score_full_interview([valid_items[i] for i in to_score])
+
+        # The model answers positionally; map back to conversation order
+        for idx, r in zip(to_score, groq_result.get("results", [])):
+            results[idx] = r
+
+            if idx in audits:
+                score_cache.audit(audits[idx], r)
+            elif use_cache:
+                score_cache.store(valid_items[idx]["question"], valid_items[idx]["answer"], r)
+
+    results.update(cached)
 
     total_score = 0.0
     max_possible = 0.0
@@ -561,9 +779,11 @@ def evaluate_full_interview_from_conversation(conversation):
     for idx, item in enumerate(valid_items):
         if item["force_zero"]:
             comm, just = 0.0, 0.0
+            reasoning = item["reason"]
 
-        elif idx >= len(results):
+        elif idx not in results:
             # fallback: partial credit
+            record_fallback("scoring", "incomplete_response")
             comm, just = 4.0, 4.0
             reasoning = "Scoring fallback due to incomplete model response"
         else:
@@ -609,12 +829,18 @@ def evaluate_full_interview_from_conversation(conversation):
         per_question_notes
     )
 
-    print(f"✅ FINAL SCORE: {final_score}")
-    print(f"📌 DECISION: {decision}")
+    logger.info(
+        "Interview scored",
+        extra={"final_score": final_score, "decision": decision}
+    )
 
     return {
         "final_score": final_score,
         "decision": decision,
         "red_flags": red_flags,
-        "hr_summary": hr_summary
+        "hr_summary": hr_summary,
+        "question_scores": [
+            {k: note[k] for k in ("question", "communication", "justification", "reasoning")}
+            for note in per_question_notes
+        ]
     }
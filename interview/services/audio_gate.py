@@ -0,0 +1,140 @@
+# interview/services/audio_gate.py
+import logging
+import wave
+
+import numpy as np
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+TARGET_RATE = 16000
+FRAME_MS = 30
+PADDING_MS = 200
+MIN_SPEECH_MS = 300
+
+SAMPLE_TYPES = {1: np.uint8, 2: np.int16, 4: np.int32}
+
+
+def should_fetch_recording(recording_duration) -> bool:
+    """Twilio sends RecordingDuration in seconds; skip clips too short to hold an answer."""
+    try:
+        return float(recording_duration) >= settings.STT_MIN_RECORDING_SECONDS
+    except (TypeError, ValueError):
+        return True
+
+
+def read_wav(path):
+    with wave.open(path, "rb") as wav:
+        width = wav.getsampwidth()
+        channels = wav.getnchannels()
+        rate = wav.getframerate()
+        raw = wav.readframes(wav.getnframes())
+
+    dtype = SAMPLE_TYPES.get(width)
+    if dtype is None:
+        return None, rate
+
+    samples = np.frombuffer(raw, dtype=dtype).astype(np.float32)
+    if width == 1:
+        samples -= 128.0
+    samples /= float(2 ** (8 * width - 1))
+
+    # Mix down to mono
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+
+    return samples, rate
+
+
+def write_wav(path, samples, rate):
+    pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(pcm.tobytes())
+
+
+def frame_levels_db(samples, rate):
+    frame = max(int(rate * FRAME_MS / 1000), 1)
+    count = len(samples) // frame
+    if count == 0:
+        return np.array([]), frame
+
+    frames = samples[:count * frame].reshape(count, frame)
+    rms = np.sqrt(np.mean(frames ** 2, axis=1))
+    return 20 * np.log10(np.maximum(rms, 1e-10)), frame
+
+
+def speech_bounds(samples, rate):
+    """Returns (start, end) sample indexes around the speech, or None for silence."""
+    levels, frame = frame_levels_db(samples, rate)
+    voiced = np.flatnonzero(levels > settings.STT_SILENCE_DBFS)
+
+    if len(voiced) * FRAME_MS < MIN_SPEECH_MS:
+        return None
+
+    padding = int(rate * PADDING_MS / 1000)
+    start = max(voiced[0] * frame - padding, 0)
+    end = min((voiced[-1] + 1) * frame + padding, len(samples))
+    return start, end
+
+
+def split_at_silence(samples, rate, target_seconds, search_seconds=5):
+    """
+    Splits audio into chunks of roughly target_seconds, cutting each one at
+    the quietest frame near the target so no word is split in half.
+    Returns a list of (start, end) sample indexes.
+    """
+    levels, frame = frame_levels_db(samples, rate)
+    target = max(int(target_seconds * 1000 / FRAME_MS), 2)
+    search = max(min(int(search_seconds * 1000 / FRAME_MS), target // 2), 1)
+
+    bounds = []
+    start = 0
+    while len(levels) - start > target + search:
+        window = levels[start + target - search:start + target + search]
+        cut = start + target - search + int(np.argmin(window))
+        bounds.append((start * frame, cut * frame))
+        start = cut
+
+    bounds.append((start * frame, len(samples)))
+    return bounds
+
+
+def downsample(samples, rate):
+    if rate <= TARGET_RATE:
+        return samples, rate
+
+    duration = len(samples) / rate
+    target_len = int(duration * TARGET_RATE)
+    positions = np.linspace(0, len(samples) - 1, target_len)
+    return np.interp(positions, np.arange(len(samples)), samples), TARGET_RATE
+
+
+def prepare_for_stt(path) -> bool:
+    """
+    Trims leading/trailing silence and rewrites the WAV as 16 kHz mono in place.
+    Returns False when the recording holds no speech and STT can be skipped.
+    Compressed recordings are passed through untouched.
+    """
+    if not path.endswith(".wav"):
+        return True
+
+    try:
+        samples, rate = read_wav(path)
+    except (wave.Error, EOFError) as e:
+        logger.error("Audio gate read error: %s", e)
+        return True
+
+    if samples is None:
+        return True
+
+    bounds = speech_bounds(samples, rate)
+    if bounds is None:
+        return False
+
+    start, end = bounds
+    samples, rate = downsample(samples[start:end], rate)
+    write_wav(path, samples, rate)
+    return True
@@ -0,0 +1,231 @@
+# interview/services/call_state.py
+"""
+Write-behind store for the hot state of live calls.
+
+While a call is in progress its conversation, question counter and pending
+turn are served from memory instead of being re-read and re-saved on every
+webhook. Saves made during a webhook are collected and written to the
+database as a single UPDATE at the turn boundary (every
+CALL_STATE_FLUSH_TURNS turns) and always at hangup.
+
+CALL_STATE_BACKEND:
+  ""       off, every save goes straight to the database
+  "local"  this process only (single web worker)
+  "cache"  the Django cache CALL_STATE_CACHE, shared across workers
+           (Redis, Memcached or the file cache, never LocMemCache)
+"""
+import threading
+import time
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from interview.metrics import stage_timer
+from interview.models import Candidate
+
+HOT_FIELDS = ("conversation", "questions_asked", "pending_turn")
+
+# Candidates loaded through the store during the current webhook
+_loaded = ContextVar("call_state_loaded", default=None)
+
+
+class LocalStore:
+    def __init__(self):
+        self._states = {}
+        self._lock = threading.Lock()
+
+    def get(self, phone):
+        with self._lock:
+            return self._states.get(phone)
+
+    def set(self, phone, state):
+        with self._lock:
+            self._states[phone] = state
+
+    def delete(self, phone):
+        with self._lock:
+            self._states.pop(phone, None)
+
+    def idle(self, seconds):
+        cutoff = time.time() - seconds
+        with self._lock:
+            return [s for s in self._states.values() if s["touched"] < cutoff]
+
+
+class CacheStore:
+    def __init__(self, alias):
+        from django.core.cache import caches
+        from django.core.cache.backends.locmem import LocMemCache
+
+        self.cache = caches[alias]
+        # Per-process memory would silently fork the call state between workers
+        if isinstance(self.cache, LocMemCache):
+            raise ImproperlyConfigured(
+                f"CALL_STATE_BACKEND=cache needs a shared cache; '{alias}' is LocMemCache. "
+                "Set REDIS_URL or use CALL_STATE_BACKEND=local with a single worker."
+            )
+
+    def key(self, phone):
+        return f"call_state:{phone}"
+
+    def get(self, phone):
+        return self.cache.get(self.key(phone))
+
+    def set(self, phone, state):
+        self.cache.set(self.key(phone), state, timeout=settings.CALL_STATE_TTL)
+
+    def delete(self, phone):
+        self.cache.delete(self.key(phone))
+
+    def idle(self, seconds):
+        # Entries expire on their own; unflushed turns are bounded by CALL_STATE_FLUSH_TURNS
+        return []
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    global _store
+
+    if not settings.CALL_STATE_BACKEND:
+        return None
+
+    with _store_lock:
+        if _store is None:
+            if settings.CALL_STATE_BACKEND == "cache":
+                _store = CacheStore(settings.CALL_STATE_CACHE)
+            else:
+                _store = LocalStore()
+    return _store
+
+
+def to_state(candidate, dirty=(), turns=0):
+    return {
+        "id": candidate.id,
+        "phone": candidate.phone,
+        **{field: getattr(candidate, field) for field in HOT_FIELDS},
+        "dirty": sorted(dirty),
+        "turns": turns,
+        "touched": time.time(),
+    }
+
+
+def from_state(state):
+    candidate = Candidate(
+        id=state["id"],
+        phone=state["phone"],
+        **{field: state[field] for field in HOT_FIELDS}
+    )
+    candidate._state.adding = False
+    candidate._call_state = state
+    return candidate
+
+
+def load(phone, create=False):
+    """The candidate for a live call, from the store when it holds the call."""
+    store = get_store()
+    state = store.get(phone) if store else None
+
+    if state is not None:
+        candidate = from_state(state)
+    else:
+        if create:
+            candidate, _ = Candidate.objects.get_or_create(phone=phone)
+        else:
+            candidate = Candidate.objects.get(phone=phone)
+
+        if store:
+            candidate._call_state = to_state(candidate)
+            store.set(phone, candidate._call_state)
+
+    loaded = _loaded.get()
+    if loaded is not None and store:
+        loaded.append(candidate)
+    return candidate
+
+
+def stage(candidate, fields):
+    """
+    Records a save of `fields`. Hot fields wait in the store for the next
+    flush; anything else (e.g. final scores) is written at once.
+    """
+    state = getattr(candidate, "_call_state", None)
+    store = get_store()
+    if state is None or store is None:
+        candidate.save(update_fields=fields)
+        return
+
+    cold = [f for f in fields if f not in HOT_FIELDS]
+    if cold:
+        candidate.save(update_fields=cold)
+
+    dirty = set(state["dirty"]) | {f for f in fields if f in HOT_FIELDS}
+    candidate._call_state = to_state(candidate, dirty, state["turns"])
+    store.set(candidate.phone, candidate._call_state)
+
+
+def flush(candidate):
+    state = getattr(candidate, "_call_state", None)
+    if not state or not state["dirty"]:
+        return
+
+    with stage_timer("call_state_flush", "db"):
+        candidate.save(update_fields=state["dirty"])
+
+    candidate._call_state = to_state(candidate)
+    store = get_store()
+    if store:
+        store.set(candidate.phone, candidate._call_state)
+
+
+def release(candidate):
+    """Flushes and forgets the call, e.g. at hangup or before a worker takes over."""
+    flush(candidate)
+    store = get_store()
+    if store:
+        store.delete(candidate.phone)
+    candidate._call_state = None
+
+
+def release_phone(phone):
+    store = get_store()
+    state = store.get(phone) if store and phone else None
+    if state is not None:
+        release(from_state(state))
+
+
+def end_of_turn(candidate):
+    state = getattr(candidate, "_call_state", None)
+    store = get_store()
+    if not state or not store:
+        return
+
+    turns = state["turns"] + (1 if state["dirty"] else 0)
+    if turns >= settings.CALL_STATE_FLUSH_TURNS:
+        flush(candidate)
+    else:
+        candidate._call_state = {**state, "turns": turns}
+        store.set(candidate.phone, candidate._call_state)
+
+    # Calls that hung up without a status callback
+    for idle in store.idle(settings.CALL_STATE_TTL):
+        release(from_state(idle))
+
+
+def write_behind(view):
+    """Turn boundary: runs end_of_turn for candidates the webhook loaded."""
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        token = _loaded.set([])
+        try:
+            return view(request, *args, **kwargs)
+        finally:
+            loaded = _loaded.get()
+            _loaded.reset(token)
+            for candidate in loaded:
+                end_of_turn(candidate)
+    return wrapper
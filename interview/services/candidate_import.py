@@ -0,0 +1,145 @@
+# interview/services/candidate_import.py
+import csv
+import io
+import re
+
+from django.conf import settings
+from django.db import transaction
+
+from interview.models import Candidate
+from interview.services.dialer import enqueue
+
+BATCH_SIZE = 1000
+PHONE_COLUMNS = ("phone", "phone_number", "mobile", "number", "contact")
+NON_DIGITS = re.compile(r"[\s\-().]")
+
+
+def normalize_phone(raw):
+    """Returns the number in E.164 form (+<country><number>), or None if invalid."""
+    if raw is None:
+        return None
+
+    phone = NON_DIGITS.sub("", str(raw).strip())
+
+    # Spreadsheets often store numbers as floats
+    if phone.endswith(".0"):
+        phone = phone[:-2]
+
+    if phone.startswith("00"):
+        phone = "+" + phone[2:]
+    elif phone.startswith("0") and len(phone) == 11:
+        phone = settings.DEFAULT_PHONE_COUNTRY_CODE + phone[1:]
+    elif not phone.startswith("+") and len(phone) == 10:
+        phone = settings.DEFAULT_PHONE_COUNTRY_CODE + phone
+    elif not phone.startswith("+"):
+        phone = "+" + phone
+
+    digits = phone[1:]
+    if not digits.isdigit() or not 8 <= len(digits) <= 15:
+        return None
+
+    return phone
+
+
+def phone_column(header):
+    names = [str(h or "").strip().lower() for h in header]
+    for name in PHONE_COLUMNS:
+        if name in names:
+            return names.index(name)
+    return 0
+
+
+def iter_csv_phones(uploaded_file):
+    text = io.TextIOWrapper(uploaded_file.file, encoding="utf-8-sig", newline="")
+    reader = csv.reader(text)
+
+    header = next(reader, None)
+    if header is None:
+        return
+
+    column = phone_column(header)
+    for row in reader:
+        yield row[column] if column < len(row) else None
+
+
+def iter_xlsx_phones(uploaded_file):
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ValueError("XLSX import needs openpyxl: pip install openpyxl")
+
+    # read_only streams rows instead of loading the whole sheet
+    workbook = load_workbook(uploaded_file.file, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+
+        header = next(rows, None)
+        if header is None:
+            return
+
+        column = phone_column(header)
+        for row in rows:
+            yield row[column] if column < len(row) else None
+    finally:
+        workbook.close()
+
+
+def iter_phones(uploaded_file):
+    name = uploaded_file.name.lower()
+    if name.endswith(".xlsx"):
+        return iter_xlsx_phones(uploaded_file)
+    if name.endswith(".csv"):
+        return iter_csv_phones(uploaded_file)
+    raise ValueError("Upload a .csv or .xlsx file")
+
+
+def insert_batch(phones, campaign, stats):
+    with transaction.atomic():
+        candidates = Candidate.objects.filter(phone__in=phones)
+        existing = set(candidates.values_list("phone", flat=True))
+
+        # ignore_conflicts covers rows inserted concurrently by another import
+        Candidate.objects.bulk_create(
+            [Candidate(phone=p) for p in phones if p not in existing],
+            ignore_conflicts=True
+        )
+        # Rows skipped as conflicts were not imported by us
+        imported = candidates.count() - len(existing)
+
+        if campaign is not None:
+            stats["queued"] += len(enqueue(campaign, candidates))
+
+    stats["imported"] += imported
+    stats["duplicates"] += len(phones) - imported
+
+
+def import_candidates(uploaded_file, campaign=None, batch_size=BATCH_SIZE):
+    """
+    Streams candidates from a CSV/XLSX upload, validating each phone number
+    row by row and inserting in batches. Optionally queues them on a campaign;
+    candidates that already have a decision or an open call job are skipped.
+    """
+    stats = {"rows": 0, "imported": 0, "duplicates": 0, "invalid": 0, "queued": 0}
+    batch = {}
+
+    for raw in iter_phones(uploaded_file):
+        stats["rows"] += 1
+        phone = normalize_phone(raw)
+
+        if phone is None:
+            stats["invalid"] += 1
+            continue
+
+        if phone in batch:
+            stats["duplicates"] += 1
+            continue
+
+        batch[phone] = None
+        if len(batch) >= batch_size:
+            insert_batch(list(batch), campaign, stats)
+            batch.clear()
+
+    if batch:
+        insert_batch(list(batch), campaign, stats)
+
+    return stats
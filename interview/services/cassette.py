@@ -0,0 +1,164 @@
+# interview/services/cassette.py
+"""
+Record/replay layer for provider calls.
+
+PROVIDER_CASSETTE_MODE=record  calls the real provider and stores the response
+                               and its latency under PROVIDER_CASSETTE_DIR
+PROVIDER_CASSETTE_MODE=replay  serves stored responses without any network,
+                               optionally sleeping for the recorded latency
+"""
+import base64
+import hashlib
+import json
+import logging
+import os
+import time
+from functools import wraps
+from types import SimpleNamespace
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CassetteMiss(LookupError):
+    pass
+
+
+def default_key(*args, **kwargs):
+    payload = json.dumps([args, kwargs], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:32]
+
+
+def file_key(file_path, *args, **kwargs):
+    """Keys audio by content, since recording paths are random per call."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(64 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()[:32]
+
+
+def url_key(url, *args, **kwargs):
+    """Keys a download by its URL alone, since the local path is random per call."""
+    return default_key(url)
+
+
+def recording_key(file_path, source=None):
+    """
+    Keys STT by the source recording when the caller knows it; the audio gate
+    rewrites the file, so its content depends on the gate settings.
+    """
+    if source:
+        return default_key(source, os.path.splitext(file_path)[1])
+    return file_key(file_path)
+
+
+def cassette_path(site, key):
+    return os.path.join(str(settings.PROVIDER_CASSETTE_DIR), site, f"{key}.json")
+
+
+def write_entry(site, key, response, elapsed):
+    path = cassette_path(site, key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({"site": site, "key": key, "elapsed": elapsed, "response": response}, f, indent=2)
+
+
+def read_entry(site, key):
+    path = cassette_path(site, key)
+    if not os.path.exists(path):
+        raise CassetteMiss(f"No recorded {site} response for key {key}")
+    with open(path) as f:
+        return json.load(f)
+
+
+def replay_delay(seconds):
+    if settings.PROVIDER_CASSETTE_REPLAY_LATENCY:
+        time.sleep(seconds)
+
+
+def cassette(site, key=default_key, dump=None, load=None, stream=False):
+    """
+    Wraps a provider call. `dump`/`load` convert the return value to and from
+    JSON; `stream=True` records a generator as its list of items.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            mode = settings.PROVIDER_CASSETTE_MODE
+            if mode not in ("record", "replay"):
+                return func(*args, **kwargs)
+
+            entry_key = key(*args, **kwargs)
+
+            if mode == "replay":
+                entry = read_entry(site, entry_key)
+                if stream:
+                    return replay_stream(entry)
+                replay_delay(entry["elapsed"])
+                return load(entry["response"]) if load else entry["response"]
+
+            if stream:
+                return record_stream(site, entry_key, func(*args, **kwargs))
+
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            elapsed = time.perf_counter() - start
+
+            try:
+                write_entry(site, entry_key, dump(result) if dump else result, elapsed)
+            except (OSError, TypeError) as e:
+                logger.error("Cassette write failed for %s: %s", site, e)
+
+            return result
+        return wrapper
+    return decorator
+
+
+def record_stream(site, entry_key, items):
+    recorded = []
+    start = last = time.perf_counter()
+
+    for item in items:
+        now = time.perf_counter()
+        recorded.append([now - last, item])
+        last = now
+        yield item
+
+    write_entry(site, entry_key, recorded, time.perf_counter() - start)
+
+
+def replay_stream(entry):
+    for delay, item in entry["response"]:
+        replay_delay(delay)
+        yield item
+
+
+# ---- converters for non-JSON provider results ----
+
+def dump_audio_file(path):
+    # Failed downloads are recorded as failures
+    if path is None:
+        return None
+    with open(path, "rb") as f:
+        return {"path": path, "audio": base64.b64encode(f.read()).decode()}
+
+
+def load_audio_file(data):
+    if data is None:
+        return None
+    path = data["path"]
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(base64.b64decode(data["audio"]))
+    return path
+
+
+def dump_call(call):
+    return {"sid": call.sid, "status": getattr(call, "status", None)}
+
+
+def load_call(data):
+    return SimpleNamespace(**data)
@@ -0,0 +1,208 @@
+# interview/services/dialer.py
+import logging
+import time
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import F, Func, Subquery
+from django.utils import timezone
+
+from interview.models import Campaign, CallJob
+from interview.services.twilio_service import start_call
+
+LIVE_STATUSES = [CallJob.DIALING, CallJob.IN_PROGRESS]
+# A candidate with one of these is already on its way to a call
+OPEN_STATUSES = [CallJob.QUEUED, *LIVE_STATUSES]
+RETRY_RESULTS = ("busy", "no-answer")
+FAILED_RESULTS = ("failed", "canceled")
+
+logger = logging.getLogger(__name__)
+
+# A live job with no status callback for this long is assumed lost
+STALE_AFTER = timedelta(hours=1)
+# A claimed job that never got a call SID was not dialed (dialer crashed)
+UNDIALED_AFTER = timedelta(minutes=5)
+
+
+def enqueue(campaign, candidates):
+    """
+    Queues `candidates` (a queryset) on the campaign. Interviewed candidates
+    and those with an open job are skipped. Returns the new jobs.
+    """
+    candidate_ids = (
+        candidates.filter(decision="")
+        .exclude(call_jobs__status__in=OPEN_STATUSES)
+        .values_list("id", flat=True)
+        .distinct()
+    )
+    return CallJob.objects.bulk_create([
+        CallJob(campaign=campaign, candidate_id=cid) for cid in candidate_ids
+    ])
+
+
+def in_window(campaign, now=None):
+    if not campaign.window_start or not campaign.window_end:
+        return True
+
+    current = timezone.localtime(now or timezone.now()).time()
+    if campaign.window_start <= campaign.window_end:
+        return campaign.window_start <= current < campaign.window_end
+
+    # Window crosses midnight
+    return current >= campaign.window_start or current < campaign.window_end
+
+
+def live_jobs(campaign=None):
+    jobs = CallJob.objects.filter(status__in=LIVE_STATUSES)
+    if campaign is not None:
+        jobs = jobs.filter(campaign=campaign)
+    return jobs
+
+
+def live_calls(campaign=None):
+    return live_jobs(campaign).count()
+
+
+def live_count(campaign=None):
+    # COUNT as a plain function, so the subquery gets no GROUP BY
+    return Subquery(
+        live_jobs(campaign).order_by().annotate(n=Func(F("id"), function="COUNT")).values("n")
+    )
+
+
+def release_stale():
+    now = timezone.now()
+
+    # Undialed jobs go back to the queue; they never reached the candidate
+    requeued = CallJob.objects.filter(
+        status=CallJob.DIALING,
+        call_sid="",
+        updated_at__lt=now - UNDIALED_AFTER
+    ).update(status=CallJob.QUEUED, updated_at=now)
+
+    failed = CallJob.objects.filter(
+        status__in=LIVE_STATUSES,
+        updated_at__lt=now - STALE_AFTER
+    ).update(status=CallJob.FAILED, last_result="stale")
+
+    return requeued + failed
+
+
+def claim_next(campaign, global_limit, candidate=None):
+    """
+    Moves the next due job (of `candidate`, if given) to DIALING when both
+    the campaign's and the global concurrency limit allow another call.
+    Returns the job, or None.
+
+    The claim is one conditional UPDATE that counts the live calls itself
+    and must change exactly one row. SQLite runs it under the database
+    write lock; on Postgres the campaign row lock serializes the claims of
+    a campaign, and the global limit is exact with one run_dialer process.
+    """
+    now = timezone.now()
+
+    with transaction.atomic():
+        campaign = Campaign.objects.select_for_update().get(id=campaign.id)
+
+        jobs = (
+            CallJob.objects.select_for_update(skip_locked=True)
+            .filter(campaign=campaign, status=CallJob.QUEUED)
+            .exclude(next_attempt_at__gt=now)
+        )
+        if candidate is not None:
+            jobs = jobs.filter(candidate=candidate)
+
+        job = jobs.select_related("candidate").order_by("next_attempt_at", "id").first()
+        if job is None:
+            return None
+
+        claimed = (
+            CallJob.objects.filter(id=job.id, status=CallJob.QUEUED)
+            .alias(campaign_live=live_count(campaign), all_live=live_count())
+            .filter(campaign_live__lt=campaign.max_concurrent, all_live__lt=global_limit)
+            .update(status=CallJob.DIALING, updated_at=now)
+        )
+        if claimed != 1:
+            # At capacity, or another dialer took the job
+            return None
+
+    job.status = CallJob.DIALING
+    job.updated_at = now
+    return job
+
+
+def dial(job):
+    job.attempts += 1
+
+    try:
+        call = start_call(job.candidate.phone, status_callback=True)
+        job.call_sid = call.sid
+        job.status = CallJob.DIALING
+    except Exception as e:
+        logger.error("Dialer error: %s", e, extra={"job_id": job.id})
+        job.last_result = "failed"
+        schedule_retry(job)
+
+    job.save(update_fields=["attempts", "call_sid", "status", "last_result", "next_attempt_at", "updated_at"])
+
+
+def schedule_retry(job):
+    if job.attempts >= job.campaign.max_attempts:
+        job.status = CallJob.FAILED
+        return
+
+    job.status = CallJob.QUEUED
+    job.next_attempt_at = timezone.now() + timedelta(
+        minutes=job.campaign.retry_delay_minutes
+    )
+
+
+def dispatch(campaign, global_limit):
+    """
+    Dials due jobs for one campaign, paced at calls_per_second and capped by
+    both the campaign's and the global concurrency limit.
+    Returns the number of calls placed.
+    """
+    if not campaign.active or not in_window(campaign):
+        return 0
+
+    interval = 1.0 / campaign.calls_per_second if campaign.calls_per_second > 0 else 0
+    dialed = placed = 0
+
+    # One job per dial, so no job waits in DIALING through the pacing sleep
+    while True:
+        if dialed and interval:
+            time.sleep(interval)
+
+        job = claim_next(campaign, global_limit)
+        if job is None:
+            return placed
+
+        dial(job)
+        dialed += 1
+        # Refused calls went back to the queue or failed
+        placed += job.status == CallJob.DIALING
+
+
+def handle_status(call_sid, call_status):
+    job = (
+        CallJob.objects.select_related("campaign")
+        .filter(call_sid=call_sid)
+        .first()
+    )
+    if job is None:
+        return None
+
+    job.last_result = call_status
+
+    if call_status == "in-progress":
+        job.status = CallJob.IN_PROGRESS
+    elif call_status == "completed":
+        job.status = CallJob.COMPLETED
+    elif call_status in RETRY_RESULTS:
+        schedule_retry(job)
+    elif call_status in FAILED_RESULTS:
+        job.status = CallJob.FAILED
+
+    job.save(update_fields=["status", "last_result", "next_attempt_at", "updated_at"])
+    return job
@@ -0,0 +1,108 @@
+# interview/services/export.py
+import csv
+import json
+import zlib
+
+from django.utils.dateparse import parse_date, parse_datetime
+
+from interview.models import Candidate
+
+CHUNK_SIZE = 2000
+
+EXPORT_FIELDS = [
+    "id",
+    "phone",
+    "created_at",
+    "updated_at",
+    "questions_asked",
+    "final_score",
+    "decision",
+    "red_flags",
+    "hr_summary",
+    "question_scores",
+]
+
+
+def parse_when(value):
+    """ISO date or datetime; raises ValueError rather than dropping the filter."""
+    if not value:
+        return None
+
+    try:
+        when = parse_datetime(value) or parse_date(value)
+    except ValueError:
+        when = None
+
+    if when is None:
+        raise ValueError(f"Expected an ISO date or datetime, got {value!r}")
+    return when
+
+
+def export_queryset(since=None, until=None, decision=None, include_conversation=False):
+    queryset = Candidate.objects.order_by("id")
+
+    since, until = parse_when(since), parse_when(until)
+    if since:
+        queryset = queryset.filter(created_at__gte=since)
+    if until:
+        queryset = queryset.filter(created_at__lt=until)
+    if decision:
+        queryset = queryset.filter(decision=decision)
+
+    fields = EXPORT_FIELDS + (["conversation"] if include_conversation else [])
+    return queryset.only(*fields), fields
+
+
+def row_dict(candidate, fields):
+    return {field: getattr(candidate, field) for field in fields}
+
+
+def iter_ndjson(queryset, fields):
+    # iterator() streams rows (server-side cursor on Postgres)
+    for candidate in queryset.iterator(chunk_size=CHUNK_SIZE):
+        yield json.dumps(row_dict(candidate, fields), default=str) + "\n"
+
+
+class Echo:
+    """csv.writer target that hands each row back instead of buffering it."""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(queryset, fields):
+    writer = csv.writer(Echo())
+    yield writer.writerow(fields)
+
+    for candidate in queryset.iterator(chunk_size=CHUNK_SIZE):
+        row = row_dict(candidate, fields)
+        yield writer.writerow([
+            json.dumps(v) if isinstance(v, (list, dict)) else v
+            for v in row.values()
+        ])
+
+
+def gzip_stream(chunks, flush_bytes=64 * 1024):
+    compressor = zlib.compressobj(wbits=31)  # gzip container
+    pending = 0
+
+    for chunk in chunks:
+        data = chunk.encode() if isinstance(chunk, str) else chunk
+        out = compressor.compress(data)
+        pending += len(data)
+
+        # Flush now and then so the client sees progress on slow exports
+        if pending >= flush_bytes:
+            out += compressor.flush(zlib.Z_SYNC_FLUSH)
+            pending = 0
+
+        if out:
+            yield out
+
+    yield compressor.flush()
+
+
+def export_stream(fmt="ndjson", gzip=False, **filters):
+    queryset, fields = export_queryset(**filters)
+    chunks = iter_csv(queryset, fields) if fmt == "csv" else iter_ndjson(queryset, fields)
+    return gzip_stream(chunks) if gzip else chunks
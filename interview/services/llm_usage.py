@@ -0,0 +1,179 @@
+# interview/services/llm_usage.py
+"""
+Token accounting and model routing for Groq requests.
+
+Every request is recorded as an LLMUsage row against the interview in the
+current trace context, labelled with its call site. Rows are buffered in
+the process and written in bulk (every LLM_USAGE_FLUSH_ROWS rows or
+LLM_USAGE_FLUSH_SECONDS, at hangup and at exit), so live turns don't pay
+for an INSERT per request.
+
+The model for a site comes from LLM_SITE_MODELS; once an interview has
+used LLM_INTERVIEW_TOKEN_BUDGET tokens, every site except final scoring
+falls back to LLM_BUDGET_MODEL.
+"""
+import atexit
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+
+from interview import tracing
+from interview.metrics import LLM_TOKENS
+from interview.models import LLMUsage
+
+logger = logging.getLogger(__name__)
+
+# USD per million tokens (input, output)
+MODEL_PRICES = {
+    "llama-3.1-8b-instant": (0.05, 0.08),
+    "llama-3.3-70b-versatile": (0.59, 0.79),
+    "openai/gpt-oss-20b": (0.075, 0.30),
+    "openai/gpt-oss-120b": (0.15, 0.60),
+}
+
+# The hire decision is never downgraded to save tokens
+BUDGET_EXEMPT_SITES = {"scoring"}
+
+_site = ContextVar("llm_call_site", default="other")
+
+_pending = []
+_pending_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+
+@contextmanager
+def call_site(name):
+    token = _site.set(name)
+    try:
+        yield
+    finally:
+        _site.reset(token)
+
+
+def current_site():
+    return _site.get()
+
+
+def interview_tokens(candidate_id):
+    total = LLMUsage.objects.filter(candidate_id=candidate_id).aggregate(
+        tokens=Sum("prompt_tokens") + Sum("completion_tokens")
+    )["tokens"]
+
+    with _pending_lock:
+        pending = sum(
+            row.prompt_tokens + row.completion_tokens
+            for row in _pending if row.candidate_id == candidate_id
+        )
+
+    return (total or 0) + pending
+
+
+def choose_model(site):
+    model = settings.LLM_SITE_MODELS.get(site, settings.LLM_DEFAULT_MODEL)
+
+    if site in BUDGET_EXEMPT_SITES:
+        return model
+
+    budget = settings.LLM_INTERVIEW_TOKEN_BUDGET
+    candidate_id = tracing.current().get("candidate_id")
+    if budget and candidate_id and model != settings.LLM_BUDGET_MODEL:
+        if interview_tokens(candidate_id) >= budget:
+            logger.info("Token budget reached, routing to budget model", extra={"site": site})
+            return settings.LLM_BUDGET_MODEL
+
+    return model
+
+
+def cost(model, prompt_tokens, completion_tokens):
+    input_price, output_price = MODEL_PRICES.get(model, (0.0, 0.0))
+    return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+
+def record(site, model, usage, seconds):
+    """Buffers one request's usage; accounting never fails the request."""
+    if usage is None:
+        return
+
+    prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+    completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+
+    LLM_TOKENS.labels(site, model, "prompt").inc(prompt_tokens)
+    LLM_TOKENS.labels(site, model, "completion").inc(completion_tokens)
+
+    ctx = tracing.current()
+    row = LLMUsage(
+        candidate_id=ctx.get("candidate_id"),
+        call_sid=ctx.get("call_sid") or "",
+        site=site,
+        model=model,
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        latency_ms=round(seconds * 1000),
+        cost_usd=cost(model, prompt_tokens, completion_tokens),
+    )
+
+    with _pending_lock:
+        _pending.append(row)
+        due = (
+            len(_pending) >= settings.LLM_USAGE_FLUSH_ROWS
+            or time.monotonic() - _last_flush >= settings.LLM_USAGE_FLUSH_SECONDS
+        )
+
+    if due:
+        flush()
+
+
+def flush():
+    """Writes the buffered rows in one bulk INSERT. Returns the number written."""
+    global _last_flush
+
+    with _pending_lock:
+        rows = _pending[:]
+        _pending.clear()
+        _last_flush = time.monotonic()
+
+    if not rows:
+        return 0
+
+    try:
+        LLMUsage.objects.bulk_create(rows)
+    except Exception as e:
+        logger.error("LLM usage write failed: %s", e, extra={"rows": len(rows)})
+        return 0
+
+    return len(rows)
+
+
+atexit.register(flush)
+
+
+def totals(queryset):
+    return queryset.annotate(
+        requests=Count("id"),
+        prompt=Sum("prompt_tokens"),
+        completion=Sum("completion_tokens"),
+        cost=Sum("cost_usd"),
+        latency_total=Sum("latency_ms"),
+    )
+
+
+def usage_by_interview(candidate_id):
+    return list(totals(
+        LLMUsage.objects.filter(candidate_id=candidate_id).values("site", "model")
+    ).order_by("site"))
+
+
+def usage_by_day(since=None):
+    queryset = LLMUsage.objects.all()
+    if since:
+        queryset = queryset.filter(created_at__gte=since)
+
+    return list(totals(
+        queryset.annotate(day=TruncDate("created_at")).values("day", "site", "model")
+    ).order_by("day", "site"))
@@ -0,0 +1,78 @@
+# interview/services/provider_health.py
+"""
+Rolling latency and error rate of the provider requests a live turn waits
+on, kept as exponentially weighted averages in the Django cache so the web
+workers, Celery workers and the dialer see the same picture (see CACHES).
+
+Only the provider requests themselves are measured (Groq chat and STT
+requests, Murf synthesis), never the stages around them, so local
+shortcuts and cache hits don't mask a slow provider. End-of-call scoring
+is not measured.
+"""
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+from django.conf import settings
+from django.core.cache import cache
+
+ALPHA = 0.2
+
+
+def key(provider):
+    return f"provider_health:{provider}"
+
+
+@contextmanager
+def measure(provider):
+    """Times one provider request; set `.failed` on the yielded probe for bad responses."""
+    probe = SimpleNamespace(failed=False)
+    start = time.perf_counter()
+    try:
+        yield probe
+    except Exception:
+        probe.failed = True
+        raise
+    finally:
+        observe(provider, time.perf_counter() - start, probe.failed)
+
+
+def observe(provider, seconds=None, failed=False):
+    if provider not in settings.ADMISSION_PROVIDER_SLO:
+        return
+
+    health = cache.get(key(provider))
+    if health is None:
+        health = {"latency": seconds or 0.0, "errors": 0.0, "degraded": False}
+
+    if seconds is not None:
+        health["latency"] += ALPHA * (seconds - health["latency"])
+    health["errors"] += ALPHA * ((1.0 if failed else 0.0) - health["errors"])
+    health["updated"] = time.time()
+    health["degraded"] = is_degraded(provider, health)
+
+    cache.set(key(provider), health, timeout=None)
+
+
+def is_degraded(provider, health):
+    slo = settings.ADMISSION_PROVIDER_SLO[provider]
+
+    # Hysteresis: once degraded, recover only well below the SLO
+    if health.get("degraded"):
+        slo *= settings.ADMISSION_RESUME_RATIO
+
+    return health["latency"] > slo or health["errors"] > settings.ADMISSION_MAX_ERROR_RATE
+
+
+def snapshot():
+    return {provider: cache.get(key(provider)) for provider in settings.ADMISSION_PROVIDER_SLO}
+
+
+def degraded_providers():
+    """Providers over their SLO. Stale readings don't count, so a quiet period lets a probe call through."""
+    cutoff = time.time() - settings.ADMISSION_HEALTH_WINDOW
+    return [
+        provider
+        for provider, health in snapshot().items()
+        if health and health["updated"] >= cutoff and health["degraded"]
+    ]
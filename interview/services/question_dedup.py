@@ -0,0 +1,127 @@
+# interview/services/question_dedup.py
+"""
+Catches questions that repeat one already asked in the interview, using
+TF-IDF cosine similarity over the questions of the conversation. Runs
+locally before any TTS or Twilio work, so a repeat never costs a turn.
+"""
+import math
+import re
+from collections import Counter
+
+from django.conf import settings
+
+from interview.metrics import record_fallback
+
+WORD = re.compile(r"[a-z0-9]+")
+
+STOP_WORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "can", "could", "did", "do",
+    "does", "for", "from", "have", "how", "i", "in", "is", "it", "me", "of",
+    "on", "or", "please", "tell", "that", "the", "this", "to", "us", "was",
+    "what", "when", "which", "would", "you", "your", "with", "about", "some",
+}
+
+# Substitutes when the model keeps repeating itself
+QUESTION_BANK = {
+    "intro": [
+        "Could you briefly walk me through your current role and responsibilities?",
+        "What made you apply for this position?",
+    ],
+    "technical": [
+        "Which tools or technologies do you use most in your daily work, and why?",
+        "Describe a technical decision you made recently and the trade-offs involved.",
+        "How do you test and verify your work before it goes live?",
+    ],
+    "problem": [
+        "Tell me about a difficult problem you faced at work and how you solved it.",
+        "Describe a time something went wrong in production. What did you do?",
+        "How do you approach a task when the requirements are unclear?",
+    ],
+    "communication": [
+        "How do you explain a technical issue to someone without a technical background?",
+        "Describe a disagreement with a teammate and how you resolved it.",
+        "How do you keep your manager updated on the progress of your work?",
+    ],
+}
+
+
+def terms(text):
+    return [w for w in WORD.findall(text.lower()) if w not in STOP_WORDS]
+
+
+def asked_questions(conversation):
+    return [
+        turn["text"]
+        for turn in conversation
+        if turn.get("role") == "ai" and turn.get("type") == "question" and turn.get("text")
+    ]
+
+
+def tfidf_vectors(documents):
+    counts = [Counter(terms(doc)) for doc in documents]
+    df = Counter(term for count in counts for term in count)
+    n = len(documents)
+
+    vectors = []
+    for count in counts:
+        vector = {
+            term: tf * (math.log((1 + n) / (1 + df[term])) + 1)
+            for term, tf in count.items()
+        }
+        norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+        vectors.append({term: w / norm for term, w in vector.items()})
+    return vectors
+
+
+def max_similarity(question, asked):
+    """Highest cosine similarity between `question` and any asked question."""
+    if not asked:
+        return 0.0
+
+    target, *others = tfidf_vectors([question, *asked])
+    return max(
+        sum(w * other.get(term, 0.0) for term, w in target.items())
+        for other in others
+    )
+
+
+def is_near_duplicate(question, asked, threshold=None):
+    if threshold is None:
+        threshold = settings.QUESTION_DEDUP_THRESHOLD
+    return max_similarity(question, asked) >= threshold
+
+
+def bank_question(intent, asked):
+    """First bank question, preferring `intent`, that wasn't already asked."""
+    intents = [intent] + [i for i in QUESTION_BANK if i != intent]
+
+    for name in intents:
+        for question in QUESTION_BANK.get(name, []):
+            if not is_near_duplicate(question, asked):
+                return name, question
+    return None, None
+
+
+def dedupe_question(ai_turn, conversation, regenerate):
+    """
+    Returns ai_turn unchanged unless its question repeats an earlier one.
+    A repeat is regenerated once with the asked questions spelled out;
+    if that repeats too, a question-bank question is substituted.
+    """
+    asked = asked_questions(conversation)
+    if not is_near_duplicate(ai_turn["text"], asked):
+        return ai_turn
+
+    retry = regenerate(conversation, asked)
+    if retry.get("text") and not is_near_duplicate(retry["text"], asked):
+        record_fallback("question_dedup", "regenerated")
+        return {**ai_turn, "intent": retry.get("intent", ai_turn["intent"]), "text": retry["text"]}
+
+    intent, question = bank_question(ai_turn["intent"], asked)
+    if question is None:
+        # Bank exhausted too; asking again beats dead air
+        record_fallback("question_dedup", "repeated")
+        return ai_turn
+
+    record_fallback("question_dedup", "question_bank")
+    return {**ai_turn, "intent": intent, "text": question}
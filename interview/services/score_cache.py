@@ -0,0 +1,135 @@
+# interview/services/score_cache.py
+"""
+Reuses per-question LLM scores for near-identical answers.
+
+Answers are embedded locally with the hashing trick (signed unigram and
+bigram counts folded into a fixed-size vector), so no model or service is
+needed. A lookup compares the answer against cached answers to the same
+normalized question; a cosine at or above SCORE_CACHE_THRESHOLD reuses
+that entry's scores.
+
+SCORE_CACHE_AUDIT_RATE sends that share of hits to the LLM anyway and
+records how far the cached scores were from the live ones.
+"""
+import hashlib
+import logging
+import random
+import re
+
+from django.conf import settings
+from django.db.models import F
+
+from interview.metrics import SCORE_CACHE, SCORE_CACHE_DRIFT
+from interview.models import ScoreCacheEntry
+
+logger = logging.getLogger(__name__)
+
+DIMENSIONS = 1024
+WORD = re.compile(r"[a-z0-9+#]+")
+FILLERS = {"um", "uh", "umm", "uhh", "hmm", "ah", "er", "like", "basically", "actually", "so"}
+
+
+def normalize(text):
+    return " ".join(w for w in WORD.findall(text.lower()) if w not in FILLERS)
+
+
+def question_key(question):
+    return hashlib.sha1(normalize(question).encode()).hexdigest()
+
+
+def feature_slot(feature):
+    digest = int.from_bytes(hashlib.blake2b(feature.encode(), digest_size=8).digest(), "big")
+    return digest % DIMENSIONS, 1.0 if digest >> 63 else -1.0
+
+
+def embed(text):
+    import numpy as np
+
+    words = normalize(text).split()
+    features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+    vector = np.zeros(DIMENSIONS, dtype=np.float32)
+    for feature in features:
+        slot, sign = feature_slot(feature)
+        vector[slot] += sign
+
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def lookup(question, answer):
+    """Returns (entry, similarity) for the closest cached answer, or (None, 0.0)."""
+    entries = list(
+        ScoreCacheEntry.objects
+        .filter(question_key=question_key(question))
+        .order_by("-id")[:settings.SCORE_CACHE_MAX_ENTRIES]
+    )
+    if not entries:
+        return None, 0.0
+
+    import numpy as np
+
+    matrix = np.stack([np.frombuffer(bytes(e.vector), dtype=np.float32) for e in entries])
+    similarities = matrix @ embed(answer)
+    best = int(np.argmax(similarities))
+    return entries[best], float(similarities[best])
+
+
+def cached_scores(question, answer):
+    """
+    Returns (scores, audit_entry). scores is a dict with communication,
+    justification and reasoning on a hit, else None. audit_entry is set
+    when a hit was sampled for live re-scoring; the caller scores it and
+    passes the result to audit().
+    """
+    if not settings.SCORE_CACHE_ENABLED:
+        return None, None
+
+    entry, similarity = lookup(question, answer)
+
+    if entry is None or similarity < settings.SCORE_CACHE_THRESHOLD:
+        SCORE_CACHE.labels("miss").inc()
+        return None, None
+
+    if random.random() < settings.SCORE_CACHE_AUDIT_RATE:
+        SCORE_CACHE.labels("audit").inc()
+        return None, entry
+
+    SCORE_CACHE.labels("hit").inc()
+    ScoreCacheEntry.objects.filter(pk=entry.pk).update(hits=F("hits") + 1)
+
+    return {
+        "communication": entry.communication,
+        "justification": entry.justification,
+        "reasoning": entry.reasoning,
+    }, None
+
+
+def store(question, answer, result):
+    if not settings.SCORE_CACHE_ENABLED:
+        return
+
+    ScoreCacheEntry.objects.create(
+        question_key=question_key(question),
+        question=question,
+        answer=answer,
+        vector=embed(answer).tobytes(),
+        communication=float(result.get("communication", 0)),
+        justification=float(result.get("justification", 0)),
+        reasoning=result.get("reasoning", ""),
+    )
+
+
+def audit(entry, result):
+    """Records how far a cached entry was from a live score of a similar answer."""
+    drift = max(
+        abs(entry.communication - float(result.get("communication", 0))),
+        abs(entry.justification - float(result.get("justification", 0))),
+    )
+    SCORE_CACHE_DRIFT.observe(drift)
+
+    if drift >= 3:
+        logger.warning(
+            "Cached score drifted from live score",
+            extra={"score_cache_entry": entry.pk, "drift": drift}
+        )
@@ -0,0 +1,37 @@
+# interview/services/scoring.py
+from interview.services.ai_analysis import evaluate_full_interview_from_conversation
+from interview.tracing import bind_candidate
+
+SCORE_FIELDS = [
+    "final_score",
+    "decision",
+    "red_flags",
+    "hr_summary",
+    "question_scores",
+    "questions_asked",
+]
+
+
+def count_ai_questions(conversation):
+    return sum(
+        1 for turn in conversation
+        if turn.get("role") == "ai"
+        and turn.get("type") == "question"
+    )
+
+
+def apply_scores(candidate, use_cache=True):
+    """Scores the interview onto `candidate` and returns the fields to save."""
+    # Token usage of the scoring request is booked to this interview
+    bind_candidate(candidate.id)
+
+    result = evaluate_full_interview_from_conversation(candidate.conversation, use_cache=use_cache)
+
+    candidate.final_score = result.get("final_score", 0)
+    candidate.decision = result.get("decision", "REJECT")
+    candidate.red_flags = result.get("red_flags", [])
+    candidate.hr_summary = result.get("hr_summary", "")
+    candidate.question_scores = result.get("question_scores", [])
+    candidate.questions_asked = count_ai_questions(candidate.conversation)
+
+    return SCORE_FIELDS
@@ -0,0 +1,110 @@
+# interview/services/search.py
+import re
+
+from django.db import connection
+
+from interview.models import AnswerDocument
+
+WORD = re.compile(r"\w+", re.UNICODE)
+SNIPPET_WORDS = 16
+
+
+def last_question(conversation, before):
+    for turn in reversed(conversation[:before]):
+        if turn.get("role") == "ai" and turn.get("type") == "question":
+            return turn.get("text", "")
+    return ""
+
+
+def index_answer(candidate, conversation):
+    """Adds the latest candidate answer to the full-text index."""
+    turn_index = len(conversation) - 1
+    AnswerDocument.objects.get_or_create(
+        candidate=candidate,
+        turn_index=turn_index,
+        defaults={
+            "question": last_question(conversation, turn_index),
+            "answer": conversation[turn_index].get("text", ""),
+        },
+    )
+
+
+def reindex_candidate(candidate):
+    """Rebuilds the candidate's documents, e.g. after turns shifted."""
+    AnswerDocument.objects.filter(candidate=candidate).delete()
+    AnswerDocument.objects.bulk_create(answer_documents(candidate))
+
+
+def answer_documents(candidate):
+    return [
+        AnswerDocument(
+            candidate=candidate,
+            turn_index=i,
+            question=last_question(candidate.conversation, i),
+            answer=turn.get("text", ""),
+        )
+        for i, turn in enumerate(candidate.conversation or [])
+        if turn.get("role") == "candidate" and turn.get("text")
+    ]
+
+
+def fts5_query(text):
+    # Every word must match; quoting keeps user input out of FTS5 syntax
+    return " ".join(f'"{word}"' for word in WORD.findall(text))
+
+
+def search_answers(text, limit=20):
+    """
+    Ranked answers matching all words of `text`, best first, with a
+    highlighted snippet. Returns [] on databases without a full-text index.
+    """
+    if not WORD.search(text or ""):
+        return []
+
+    if connection.vendor == "sqlite":
+        sql = f"""
+            SELECT d.candidate_id, c.phone, d.turn_index, d.question,
+                   snippet(interview_answer_fts, 1, '[', ']', '…', {SNIPPET_WORDS}),
+                   -bm25(interview_answer_fts, 0.5, 1.0)
+            FROM interview_answer_fts
+            JOIN interview_answerdocument d ON d.id = interview_answer_fts.rowid
+            JOIN interview_candidate c ON c.id = d.candidate_id
+            WHERE interview_answer_fts MATCH %s
+            ORDER BY bm25(interview_answer_fts, 0.5, 1.0)
+            LIMIT %s
+        """
+        params = [fts5_query(text), limit]
+
+    elif connection.vendor == "postgresql":
+        sql = f"""
+            SELECT d.candidate_id, c.phone, d.turn_index, d.question,
+                   ts_headline('english', d.answer, q,
+                               'StartSel=[, StopSel=], MaxWords={SNIPPET_WORDS}, MinWords=5'),
+                   ts_rank_cd(d.search_vector, q)
+            FROM interview_answerdocument d
+            JOIN interview_candidate c ON c.id = d.candidate_id,
+                 websearch_to_tsquery('english', %s) q
+            WHERE d.search_vector @@ q
+            ORDER BY ts_rank_cd(d.search_vector, q) DESC
+            LIMIT %s
+        """
+        params = [text, limit]
+
+    else:
+        return []
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    return [
+        {
+            "candidate_id": candidate_id,
+            "phone": phone,
+            "turn_index": turn_index,
+            "question": question,
+            "snippet": snippet,
+            "rank": round(rank, 4),
+        }
+        for candidate_id, phone, turn_index, question, snippet, rank in rows
+    ]
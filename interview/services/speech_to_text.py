@@ -48,16 +48,91 @@
 #         print("❌ AssemblyAI exception:", e)
 #         return ""
 
-from groq import Groq
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from functools import lru_cache
+
+import requests
+from requests.auth import HTTPBasicAuth
 from config import settings
+from interview.metrics import record_error
+from interview.tracing import span
+from interview.services import provider_health
+from interview.services.cassette import (
+    cassette,
+    dump_audio_file,
+    load_audio_file,
+    recording_key,
+    url_key,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def get_client():
+    from groq import Groq
+    return Groq(api_key=settings.GROQ_API_KEY, base_url=settings.GROQ_BASE_URL)
+
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
-client = Groq(api_key=settings.GROQ_API_KEY)
 
+def download_recording(recording_url, local_base, fmt=None):
+    """
+    Streams a Twilio recording to local_base.<fmt> in chunks.
+    Twilio serves the same recording as .wav or the much smaller .mp3.
+    Returns the local path, or None if the download failed.
+    """
+    fmt = fmt or settings.RECORDING_FORMAT
+    local_path = f"{local_base}.{fmt}"
+    fetched = fetch_recording(f"{recording_url}.{fmt}", local_path)
 
-def transcribe_audio(file_path):
+    # A replayed download is restored where it was recorded
+    if fetched and fetched != local_path:
+        os.replace(fetched, local_path)
+        return local_path
+
+    return fetched
+
+
+@cassette("download_recording", key=url_key, dump=dump_audio_file, load=load_audio_file)
+def fetch_recording(url, local_path):
     try:
-        with open(file_path, "rb") as audio_file:
-            transcription = client.audio.transcriptions.create(
+        with requests.get(
+            url,
+            auth=HTTPBasicAuth(settings.TWILIO_SID, settings.TWILIO_AUTH),
+            stream=True,
+            timeout=30
+        ) as r:
+            r.raise_for_status()
+
+            with open(local_path, "wb") as f:
+                for chunk in r.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+
+    except requests.RequestException as e:
+        logger.error("Recording download error: %s", e)
+        record_error("download", "twilio")
+        return None
+
+    return local_path
+
+
+@cassette("transcribe_audio", key=recording_key)
+def transcribe_audio(file_path, source=None):
+    """`source` (the recording URL) only keys the cassette."""
+    if settings.STT_BACKEND == "whisper":
+        return transcribe_local(file_path)
+    return transcribe_groq(file_path)
+
+
+def transcribe_groq(file_path):
+    try:
+        with open(file_path, "rb") as audio_file, span("groq.whisper"), provider_health.measure("groq_stt"):
+            transcription = get_client().audio.transcriptions.create(
                 file=audio_file,
                 model="whisper-large-v3",
                 language="en"
@@ -67,5 +142,79 @@ def transcribe_audio(file_path):
         return transcription.text.strip() if transcription.text else ""
 
     except Exception as e:
-        print("❌ Groq Whisper STT error:", e)
+        logger.error("Groq Whisper STT error: %s", e)
+        record_error("stt", "groq")
+        return ""
+
+
+_whisper_model = None
+
+
+def transcribe_local(file_path):
+    """Local openai-whisper backend; the model is loaded once per process."""
+    global _whisper_model
+
+    try:
+        if _whisper_model is None:
+            import whisper
+            _whisper_model = whisper.load_model(settings.STT_WHISPER_MODEL)
+
+        with span("whisper.local"):
+            result = _whisper_model.transcribe(file_path, language="en", fp16=False)
+        return result.get("text", "").strip()
+
+    except Exception as e:
+        logger.error("Local Whisper STT error: %s", e)
+        record_error("stt", "whisper")
         return ""
+
+
+_chunk_executor = None
+
+
+def get_chunk_executor():
+    # Remote calls are I/O bound; local Whisper needs real processes
+    global _chunk_executor
+
+    if _chunk_executor is None:
+        if settings.STT_BACKEND == "whisper":
+            _chunk_executor = ProcessPoolExecutor(max_workers=settings.STT_CHUNK_WORKERS)
+        else:
+            _chunk_executor = ThreadPoolExecutor(max_workers=settings.STT_CHUNK_WORKERS)
+
+    return _chunk_executor
+
+
+def transcribe_audio_chunked(file_path):
+    """
+    Splits a long WAV at silence boundaries, transcribes the chunks
+    concurrently and stitches the text back in order.
+    Short or compressed recordings go through transcribe_audio as one piece.
+    """
+    from interview.services.audio_gate import read_wav, write_wav, split_at_silence
+
+    if not file_path.endswith(".wav"):
+        return transcribe_audio(file_path)
+
+    samples, rate = read_wav(file_path)
+    if samples is None:
+        return transcribe_audio(file_path)
+
+    bounds = split_at_silence(samples, rate, settings.STT_CHUNK_SECONDS)
+    if len(bounds) < 2:
+        return transcribe_audio(file_path)
+
+    base, _ = os.path.splitext(file_path)
+    chunk_paths = []
+    for i, (start, end) in enumerate(bounds):
+        chunk_path = f"{base}_part{i}.wav"
+        write_wav(chunk_path, samples[start:end], rate)
+        chunk_paths.append(chunk_path)
+
+    try:
+        texts = list(get_chunk_executor().map(transcribe_audio, chunk_paths))
+    finally:
+        for chunk_path in chunk_paths:
+            os.remove(chunk_path)
+
+    return " ".join(t for t in texts if t)
@@ -0,0 +1,115 @@
+# interview/services/tts_stream.py
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from interview.services.TTS_genrater import murf_tts
+
+logger = logging.getLogger(__name__)
+
+TTS_WORKERS = 4
+SEGMENT_TIMEOUT = 20
+# Pipelines of calls that ended without a status callback are dropped after this
+PIPELINE_TTL = 15 * 60
+
+_executor = ThreadPoolExecutor(max_workers=TTS_WORKERS)
+# In this process only: /voice/segment/ must reach the worker that started
+# the question, so TTS_STREAMING needs a single web worker (threads are fine)
+_pipelines = {}
+_pipelines_lock = threading.Lock()
+
+
+class SentencePipeline:
+    """
+    Sends each sentence to TTS as soon as the LLM finishes it, so the first
+    segment can play while later sentences are still being generated.
+    """
+
+    def __init__(self, intent, sentences):
+        self.intent = intent
+        self.sentences = []
+        self.segments = []
+        self.done = False
+        self.started_at = time.monotonic()
+        self._cond = threading.Condition()
+
+        # Carry the call's trace context into the pipeline thread
+        context = contextvars.copy_context()
+        threading.Thread(
+            target=context.run, args=(self._run, sentences), daemon=True
+        ).start()
+
+    def _run(self, sentences):
+        try:
+            for sentence in sentences:
+                with self._cond:
+                    self.sentences.append(sentence)
+                    self.segments.append(_executor.submit(
+                        contextvars.copy_context().run, murf_tts, sentence
+                    ))
+                    self._cond.notify_all()
+        except Exception as e:
+            logger.error("Sentence pipeline error: %s", e)
+        finally:
+            with self._cond:
+                self.done = True
+                self._cond.notify_all()
+
+    def segment(self, index, timeout=SEGMENT_TIMEOUT):
+        """
+        Returns (sentence, audio_path) for the index-th segment, waiting for
+        it if needed. audio_path is None when TTS failed for that sentence.
+        Returns (None, None) once the question is exhausted.
+        """
+        with self._cond:
+            self._cond.wait_for(
+                lambda: index < len(self.segments) or self.done,
+                timeout
+            )
+            if index >= len(self.segments):
+                return None, None
+            sentence = self.sentences[index]
+            future = self.segments[index]
+
+        try:
+            return sentence, future.result(timeout=timeout)
+        except Exception as e:
+            logger.error("Segment TTS error: %s", e)
+            return sentence, None
+
+    def is_ready(self, index):
+        with self._cond:
+            if index < len(self.segments):
+                return self.segments[index].done()
+            return self.done
+
+    @property
+    def text(self):
+        with self._cond:
+            return " ".join(self.sentences)
+
+    def text_until(self, index):
+        with self._cond:
+            return " ".join(self.sentences[:index])
+
+
+def start_pipeline(key, intent, sentences):
+    pipeline = SentencePipeline(intent, sentences)
+    expired = pipeline.started_at - PIPELINE_TTL
+    with _pipelines_lock:
+        for stale in [k for k, p in _pipelines.items() if p.started_at < expired]:
+            del _pipelines[stale]
+        _pipelines[key] = pipeline
+    return pipeline
+
+
+def get_pipeline(key):
+    with _pipelines_lock:
+        return _pipelines.get(key)
+
+
+def finish_pipeline(key):
+    with _pipelines_lock:
+        return _pipelines.pop(key, None)
@@ -0,0 +1,232 @@
+# interview/services/turns.py
+"""
+The work of one interview turn, shared by the webhook (synchronous turns)
+and the live Celery queue (TURN_ASYNC): transcribe the reply, store it and
+decide the next question.
+"""
+import os
+import uuid
+
+from django.conf import settings
+
+from interview.metrics import stage_timer, record_fallback
+from interview.services import call_state
+from interview.services.ai_analysis import generate_ai_turn, regenerate_question
+from interview.services.question_dedup import dedupe_question
+from interview.services.scoring import count_ai_questions
+from interview.services.search import index_answer, reindex_candidate
+from interview.services.speech_to_text import (
+    transcribe_audio,
+    transcribe_audio_chunked,
+    download_recording
+)
+
+MIN_QUESTIONS = 4
+
+# Twilio webhook parameters a turn needs
+REPLY_PARAMS = ("SpeechResult", "RecordingUrl", "RecordingDuration")
+
+
+def normalize_ai_turn(ai_turn):
+    action = ai_turn.get("action")
+
+    if not ai_turn.get("text") and action != "end_interview":
+        record_fallback("generate_ai_turn", "default_question")
+
+    if action == "ask":
+        action = "ask_question"
+
+    return {
+        "action": action or "ask_question",
+        "intent": ai_turn.get("intent", "general"),
+        "text": ai_turn.get("text", "Could you explain more?")
+    }
+
+
+def is_warmup_reply(text: str) -> bool:
+    if not text:
+        return True
+    return len(text.strip().split()) <= 3
+
+
+def is_long_answer(recording_duration) -> bool:
+    if not settings.STT_CHUNKED:
+        return False
+    try:
+        return float(recording_duration) >= settings.STT_CHUNK_MIN_SECONDS
+    except (TypeError, ValueError):
+        return False
+
+
+def save_candidate(candidate, fields):
+    # Held back until the turn boundary when the call state is write-behind
+    with stage_timer("db_save", "db"):
+        call_state.stage(candidate, fields)
+
+
+def reply_params(post):
+    return {key: post[key] for key in REPLY_PARAMS if key in post}
+
+
+def transcribe_reply(candidate, params):
+    """Text of the candidate's reply, or None when the webhook carried none."""
+    if "SpeechResult" in params:
+        # Twilio transcribed the reply inline, nothing to fetch or send to STT
+        return params.get("SpeechResult", "")
+
+    if "RecordingUrl" not in params:
+        return None
+
+    # numpy is only needed once an answer was recorded
+    from interview.services.audio_gate import should_fetch_recording, prepare_for_stt
+
+    text = ""
+    duration = params.get("RecordingDuration")
+
+    # Skip empty clips without downloading them
+    if not should_fetch_recording(duration):
+        record_fallback("stt", "too_short")
+        return text
+
+    chunked = is_long_answer(duration)
+
+    with stage_timer("download", "twilio"):
+        local_path = download_recording(
+            params["RecordingUrl"],
+            f"media/recordings/{candidate.id}_{uuid.uuid4().hex}",
+            # chunk splitting needs raw PCM
+            fmt="wav" if chunked else None
+        )
+
+    # Silence-only recordings never reach STT
+    if local_path and not prepare_for_stt(local_path):
+        record_fallback("stt", "silence")
+
+    elif local_path:
+        with stage_timer("stt", settings.STT_BACKEND):
+            if chunked:
+                text = transcribe_audio_chunked(local_path)
+            else:
+                text = transcribe_audio(local_path, source=params["RecordingUrl"])
+
+    if local_path:
+        os.remove(local_path)
+
+    return text
+
+
+def answer_entry(text):
+    # Ignore warm-up replies
+    if text is None or is_warmup_reply(text):
+        return None
+    return {
+        "role": "candidate",
+        "type": "answer",
+        "text": text
+    }
+
+
+def question_entry(ai_turn):
+    return {
+        "role": "ai",
+        "type": "question",
+        "intent": ai_turn["intent"],
+        "text": ai_turn["text"]
+    }
+
+
+def record_answer(candidate, text):
+    conversation = candidate.conversation or []
+    entry = answer_entry(text)
+
+    if entry is not None:
+        conversation.append(entry)
+        candidate.conversation = conversation
+        save_candidate(candidate, ["conversation"])
+
+        with stage_timer("search_index", "db"):
+            index_answer(candidate, conversation)
+
+    return conversation
+
+
+def plan_next_turn(conversation):
+    """Decides the next turn for `conversation` without changing it."""
+    question_count = count_ai_questions(conversation)
+
+    ai_turn = normalize_ai_turn(generate_ai_turn(conversation))
+
+    # 🚫 Enforce minimum questions
+    if question_count < MIN_QUESTIONS:
+        ai_turn["action"] = "ask_question"
+
+    if ai_turn["action"] == "end_interview" and question_count >= MIN_QUESTIONS:
+        return ai_turn
+
+    with stage_timer("question_dedup", "local"):
+        return dedupe_question(ai_turn, conversation, regenerate_question)
+
+
+def next_question(candidate):
+    """
+    Decides the next turn. A question is appended to the conversation;
+    an "end_interview" action is returned for the caller to act on.
+    """
+    conversation = candidate.conversation or []
+    ai_turn = plan_next_turn(conversation)
+
+    if ai_turn["action"] != "end_interview":
+        conversation.append(question_entry(ai_turn))
+        candidate.conversation = conversation
+        save_candidate(candidate, ["conversation"])
+
+    return ai_turn
+
+
+def serve_turn(candidate, answer, ai_turn, late_turn_id=None):
+    """
+    Writes an async turn once the caller actually hears it: the answer the
+    worker transcribed (if any) and the question being asked, in one save
+    that also clears pending_turn.
+
+    With `late_turn_id` the worker is still busy; pending_turn then keeps
+    where its answer belongs, so the answer can be added once it arrives
+    (see merge_late_answer).
+    """
+    conversation = candidate.conversation or []
+
+    if answer is not None:
+        conversation.append(answer)
+        with stage_timer("search_index", "db"):
+            index_answer(candidate, conversation)
+
+    answer_at = len(conversation)
+    if ai_turn["action"] != "end_interview":
+        conversation.append(question_entry(ai_turn))
+
+    candidate.conversation = conversation
+    candidate.pending_turn = None
+    if late_turn_id:
+        candidate.pending_turn = {"id": late_turn_id, "status": "abandoned", "at": answer_at}
+    save_candidate(candidate, ["conversation", "pending_turn"])
+
+
+def merge_late_answer(candidate):
+    """
+    Adds the answer of an async turn that finished after the caller was
+    given a fallback question, before that question.
+    """
+    pending = candidate.pending_turn or {}
+    if pending.get("status") != "late":
+        return
+
+    conversation = candidate.conversation or []
+    if pending.get("answer"):
+        conversation.insert(pending["at"], pending["answer"])
+        candidate.conversation = conversation
+        # Later turns moved by one
+        with stage_timer("search_index", "db"):
+            reindex_candidate(candidate)
+
+    candidate.pending_turn = None
+    save_candidate(candidate, ["conversation", "pending_turn"])
@@ -1,12 +1,34 @@
 # interview/services/twilio_service.py
-from twilio.rest import Client
+from functools import lru_cache
+
 from django.conf import settings
 
-client = Client(settings.TWILIO_SID, settings.TWILIO_AUTH)
+from interview.tracing import span
+from interview.services.cassette import cassette, dump_call, load_call
+
+
+@lru_cache(maxsize=None)
+def get_client():
+    # twilio.rest pulls in every API domain; only the dialing path needs it
+    from twilio.rest import Client
+    return Client(settings.TWILIO_SID, settings.TWILIO_AUTH)
+
+
+@cassette("start_call", dump=dump_call, load=load_call)
+def start_call(phone, status_callback=False):
+    extra = {}
+    if status_callback:
+        # Lets the dialer track answered / busy / no-answer outcomes
+        extra = {
+            "status_callback": f"{settings.BASE_URL}/voice/status/",
+            "status_callback_event": ["answered", "completed"],
+            "status_callback_method": "POST",
+        }
 
-def start_call(phone):
-    return client.calls.create(
-        to=phone,
-        from_=settings.TWILIO_NUMBER,
-        url="https://meggan-spectacleless-nonreverentially.ngrok-free.dev/voice/"
-    )
+    with span("twilio.calls.create"):
+        return get_client().calls.create(
+            to=phone,
+            from_=settings.TWILIO_NUMBER,
+            url=f"{settings.BASE_URL}/voice/",
+            **extra
+        )
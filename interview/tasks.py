@@ -1,51 +1,79 @@
 # interview/tasks.py
+import logging
+
 from celery import shared_task
-from interview.services.ai_analysis import generate_ai_turn
-from interview.services.TTS_genrater import murf_tts
-from interview.services.speech_to_text import transcribe_audio
+
+from interview.metrics import record_fallback
 from interview.models import Candidate
-from config.settings import BASE_URL, MEDIA_URL
-import os
+from interview.services import llm_usage
+from interview.services.export import export_stream
+from interview.services.scoring import apply_scores
+from interview.services.turns import transcribe_reply, answer_entry, plan_next_turn
+
+logger = logging.getLogger(__name__)
+
 
 @shared_task
-def process_candidate_answer(candidate_id):
+def process_candidate_answer(candidate_id, turn_id, params):
+    """
+    Transcribes the reply carried by `params` (the Twilio webhook fields)
+    and plans the next question. Nothing is added to the conversation here:
+    /voice/turn/ writes the answer and question when it serves them. A
+    result that arrives after the poll gave up only keeps its answer, which
+    the next webhook merges (see merge_late_answer).
+    """
     candidate = Candidate.objects.get(id=candidate_id)
-    conversation = candidate.conversation
+    answer = None
+
+    try:
+        answer = answer_entry(transcribe_reply(candidate, params))
+        conversation = (candidate.conversation or []) + ([answer] if answer else [])
+        pending = {"id": turn_id, "status": "ready", "answer": answer, **plan_next_turn(conversation)}
 
-    # 1️⃣ Transcribe last answer
-    last = conversation[-1]
-    text = transcribe_audio(last["audio_path"])
-    os.remove(last["audio_path"])
+    except Exception:
+        logger.exception("Async turn failed")
+        pending = {"id": turn_id, "status": "failed", "answer": answer}
 
-    last["text"] = text
-    candidate.save(update_fields=["conversation"])
+    updated = Candidate.objects.filter(
+        id=candidate_id, pending_turn__id=turn_id, pending_turn__status="processing"
+    ).update(pending_turn=pending)
 
-    # 2️⃣ Ask LLM
-    ai_turn = generate_ai_turn(conversation)
+    # The poll gave up and served a fallback question; keep the answer for
+    # the next webhook to merge in front of it
+    if not updated:
+        abandoned = Candidate.objects.filter(
+            id=candidate_id, pending_turn__id=turn_id, pending_turn__status="abandoned"
+        )
+        state = abandoned.values_list("pending_turn", flat=True).first()
+        if state is not None:
+            updated = abandoned.update(pending_turn={**state, "status": "late", "answer": answer})
+            record_fallback("turn_async", "late")
 
-    # 3️⃣ End decision
-    if ai_turn.get("action") == "end_interview":
-        candidate.pending_ai_audio = f"{BASE_URL}/static/audio/end.mp3"
-        candidate.save(update_fields=["pending_ai_audio"])
-        return
+    # Superseded by a later turn
+    if not updated:
+        record_fallback("turn_async", "discarded")
 
-    # 4️⃣ Generate Murf TTS
-    audio_file = murf_tts(ai_turn["text"])
 
-    conversation.append({
-        "role": "ai",
-        "type": "question",
-        "intent": ai_turn.get("intent", "general"),
-        "text": ai_turn["text"]
-    })
+@shared_task
+def score_interview(candidate_id):
+    candidate = Candidate.objects.get(id=candidate_id)
+    candidate.save(update_fields=apply_scores(candidate))
+    llm_usage.flush()
 
-    candidate.conversation = conversation
-    candidate.pending_ai_audio = f"{BASE_URL}{MEDIA_URL}tts/{audio_file}"
-    candidate.questions_asked += 1
 
-    candidate.save(update_fields=[
-        "conversation",
-        "pending_ai_audio",
-        "questions_asked"
-    ])
+@shared_task
+def rescore_candidates(candidate_ids):
+    for candidate in Candidate.objects.filter(id__in=candidate_ids).order_by("id"):
+        # The cache holds these very answers; a re-score must ask the LLM
+        candidate.save(update_fields=apply_scores(candidate, use_cache=False))
+    llm_usage.flush()
 
+
+@shared_task
+def export_candidates_file(path, fmt="ndjson", gzip=False, **filters):
+    # Bad filters raise before the file is created
+    chunks = export_stream(fmt=fmt, gzip=gzip, **filters)
+    with open(path, "wb") as out:
+        for chunk in chunks:
+            out.write(chunk.encode() if isinstance(chunk, str) else chunk)
+    return path
@@ -0,0 +1,57 @@
+import json
+import logging
+import os
+import tempfile
+import unittest
+
+from django.test import SimpleTestCase
+
+from interview.tracing import BackgroundHandler, bind_call, span, stop_listeners
+
+
+@unittest.skipUnless(hasattr(os, "fork"), "needs os.fork")
+class BackgroundHandlerForkTests(SimpleTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "traces.jsonl")
+        self.handler = BackgroundHandler(self.path)
+
+        self.logger = logging.getLogger("interview.tests.fork")
+        self.logger.addHandler(self.handler)
+        self.logger.propagate = False
+
+        # span() writes to interview.spans
+        self.span_logger = logging.getLogger("interview.spans")
+        self.span_handlers = self.span_logger.handlers
+        self.span_logger.handlers = [self.handler]
+
+    def tearDown(self):
+        self.logger.removeHandler(self.handler)
+        self.span_logger.handlers = self.span_handlers
+        self.handler.close()
+        self.tmp.cleanup()
+
+    def read_entries(self):
+        with open(self.path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_forked_child_records_are_written(self):
+        self.logger.warning("from parent")
+
+        pid = os.fork()
+        if pid == 0:
+            # Like a Celery pool process: log, flush on shutdown, os._exit
+            try:
+                with bind_call("CA123"), span("child.work"):
+                    self.logger.warning("from child")
+                stop_listeners()
+            finally:
+                os._exit(0)
+
+        os.waitpid(pid, 0)
+        self.handler.stop()
+
+        messages = [entry["message"] for entry in self.read_entries()]
+        self.assertIn("from parent", messages)
+        self.assertIn("from child", messages)
+        self.assertIn("child.work", messages)
@@ -0,0 +1,243 @@
+# interview/tracing.py
+import atexit
+import hashlib
+import json
+import logging
+import os
+import queue
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from logging.handlers import QueueHandler, QueueListener
+
+span_logger = logging.getLogger("interview.spans")
+
+# {"trace_id", "span_id", "call_sid", "candidate_id"} for the current call
+_context = ContextVar("interview_trace", default=None)
+
+TRACE_FIELDS = ("trace_id", "span_id", "call_sid", "candidate_id")
+
+# Attributes every LogRecord has; anything else came in through `extra`
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {
+    "message", "asctime", "taskName",
+}
+
+
+def trace_id_for(call_sid):
+    """Stable 128-bit trace id derived from Twilio's CallSid."""
+    if not call_sid:
+        return uuid.uuid4().hex
+    return hashlib.sha1(call_sid.encode()).hexdigest()[:32]
+
+
+def new_span_id():
+    return uuid.uuid4().hex[:16]
+
+
+def current():
+    return _context.get() or {}
+
+
+@contextmanager
+def bind_call(call_sid=None, candidate_id=None, trace_id=None):
+    token = _context.set({
+        "trace_id": trace_id or trace_id_for(call_sid),
+        "span_id": None,
+        "call_sid": call_sid,
+        "candidate_id": candidate_id,
+    })
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+def bind_candidate(candidate_id):
+    ctx = _context.get()
+    if ctx is not None:
+        ctx["candidate_id"] = candidate_id
+
+
+def traced_webhook(view):
+    """Binds the Twilio CallSid of the request as the trace for the view."""
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        with bind_call(request.POST.get("CallSid")):
+            with span(f"webhook {request.path}"):
+                return view(request, *args, **kwargs)
+    return wrapper
+
+
+@contextmanager
+def span(name, **attrs):
+    parent = _context.get()
+    if parent is None:
+        # Not inside a call: nothing to correlate with
+        yield
+        return
+
+    span_id = new_span_id()
+    parent_id = parent.get("span_id")
+    token = _context.set({**parent, "span_id": span_id})
+
+    start = time.time()
+    status = "ok"
+    try:
+        yield
+    except Exception:
+        status = "error"
+        raise
+    finally:
+        _context.reset(token)
+        span_logger.info(name, extra={
+            "span": {
+                "name": name,
+                "span_id": span_id,
+                "parent_id": parent_id,
+                "start": start,
+                "duration_ms": round((time.time() - start) * 1000, 2),
+                "status": status,
+                "attributes": attrs,
+            },
+            "trace_id": parent["trace_id"],
+            "span_id": span_id,
+        })
+
+
+class TraceContextFilter(logging.Filter):
+    """Copies the current trace context onto the record in the calling thread."""
+
+    def filter(self, record):
+        ctx = _context.get() or {}
+        for field in TRACE_FIELDS:
+            if not hasattr(record, field):
+                setattr(record, field, ctx.get(field))
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and value is not None:
+                entry[key] = value
+
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc_info"] = record.exc_text
+
+        return json.dumps(entry, default=str)
+
+
+# Live BackgroundHandlers, restarted in forked children and stopped at exit
+_background_handlers = []
+
+
+class BackgroundHandler(QueueHandler):
+    """
+    Hands records to a listener thread that formats and writes them, so
+    request threads never block on stdout or file I/O.
+    """
+
+    def __init__(self, filename=None):
+        super().__init__(queue.SimpleQueue())
+        self.addFilter(TraceContextFilter())
+
+        if filename:
+            os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+            target = logging.FileHandler(filename)
+        else:
+            target = logging.StreamHandler()
+        target.setFormatter(JsonFormatter())
+
+        self.listener = QueueListener(self.queue, target)
+        self.listener.start()
+        _background_handlers.append(self)
+
+    def restart(self):
+        """A forked child inherits the queue but not the listener thread."""
+        self.queue = queue.SimpleQueue()
+        self.listener = QueueListener(self.queue, *self.listener.handlers)
+        self.listener.start()
+
+    def stop(self):
+        """Writes out the queued records and stops the listener."""
+        if self.listener._thread is not None:
+            self.listener.stop()
+
+    def close(self):
+        self.stop()
+        if self in _background_handlers:
+            _background_handlers.remove(self)
+        super().close()
+
+    def prepare(self, record):
+        # Keep the record's extra fields; the listener's formatter needs them
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def restart_listeners():
+    for handler in _background_handlers:
+        handler.restart()
+
+
+def stop_listeners():
+    for handler in _background_handlers:
+        handler.stop()
+
+
+# Celery prefork workers and the STT process pool are forked after logging
+# is configured
+os.register_at_fork(after_in_child=restart_listeners)
+atexit.register(stop_listeners)
+
+
+def connect_celery():
+    """Carries the trace context from the publisher into Celery workers."""
+    from celery.signals import (
+        before_task_publish, task_prerun, task_postrun, worker_process_shutdown,
+    )
+
+    tokens = {}
+
+    # Pool processes leave through os._exit, which skips atexit
+    @worker_process_shutdown.connect(weak=False)
+    def flush_logs(**kwargs):
+        stop_listeners()
+
+    @before_task_publish.connect(weak=False)
+    def inject(headers=None, **kwargs):
+        ctx = _context.get()
+        if ctx is not None and headers is not None:
+            headers["trace"] = {k: ctx.get(k) for k in TRACE_FIELDS}
+
+    @task_prerun.connect(weak=False)
+    def extract(task_id=None, task=None, **kwargs):
+        trace = getattr(task.request, "trace", None) or {}
+        tokens[task_id] = _context.set({
+            "trace_id": trace.get("trace_id") or uuid.uuid4().hex,
+            "span_id": trace.get("span_id"),
+            "call_sid": trace.get("call_sid"),
+            "candidate_id": trace.get("candidate_id"),
+        })
+
+    @task_postrun.connect(weak=False)
+    def reset(task_id=None, **kwargs):
+        token = tokens.pop(task_id, None)
+        if token is not None:
+            _context.reset(token)
@@ -1,7 +1,29 @@
-from django.urls import path
-from .views import voice_interview, call_ui
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+
+from .api import CandidateViewSet, ResultViewSet, AnswerSearchView
+from .views import (
+    voice_interview,
+    voice_segment,
+    voice_turn,
+    voice_status,
+    export_candidates,
+    metrics,
+    call_ui,
+)
+
+router = DefaultRouter()
+router.register("candidates", CandidateViewSet, basename="api-candidate")
+router.register("results", ResultViewSet, basename="api-result")
 
 urlpatterns = [
+    path("api/search/", AnswerSearchView.as_view()),
+    path("api/", include(router.urls)),
     path("voice/", voice_interview),
+    path("voice/segment/", voice_segment),
+    path("voice/turn/", voice_turn),
+    path("voice/status/", voice_status),
+    path("metrics", metrics),
+    path("export/", export_candidates),
     path("", call_ui, name="call_ui"),
 ]
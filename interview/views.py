@@ -1,54 +1,52 @@
+import itertools
 import os
 import uuid
-import requests
 
-from django.http import HttpResponse
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import HttpResponse, HttpResponseBadRequest, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.conf import settings
 from django.shortcuts import render
 
 from twilio.twiml.voice_response import VoiceResponse
-from requests.auth import HTTPBasicAuth
 
-from interview.models import Candidate
-from interview.services.speech_to_text import transcribe_audio
-from interview.services.ai_analysis import (
-    generate_ai_turn,
-    evaluate_full_interview_from_conversation
+from interview.models import Candidate, Campaign
+from interview.services.ai_analysis import should_end_interview, stream_ai_question
+from interview.services.question_dedup import asked_questions, is_near_duplicate
+from interview.services.dialer import handle_status
+from interview.services.candidate_import import import_candidates
+from interview.services.export import export_stream
+from interview.services import admission, call_state, llm_usage
+from interview.services.scoring import apply_scores, count_ai_questions
+from interview.services.turns import (
+    MIN_QUESTIONS,
+    normalize_ai_turn,
+    save_candidate,
+    reply_params,
+    transcribe_reply,
+    record_answer,
+    next_question,
+    serve_turn,
+    merge_late_answer
 )
-from interview.services.twilio_service import start_call
+from interview.services.tts_stream import (
+    start_pipeline,
+    get_pipeline,
+    finish_pipeline
+)
+from interview.metrics import stage_timer, timed, record_fallback, render_metrics
+from interview.tracing import traced_webhook, bind_candidate
+from interview.profiling import profiled
 from config.settings import BASE_URL
 
+# pending_turn states /voice/turn/ still answers for
+TURN_SERVABLE = ("processing", "ready", "failed")
 
-MIN_QUESTIONS = 4
-
-
-def normalize_ai_turn(ai_turn):
-    action = ai_turn.get("action")
-
-    if action == "ask":
-        action = "ask_question"
-
-    return {
-        "action": action or "ask_question",
-        "intent": ai_turn.get("intent", "general"),
-        "text": ai_turn.get("text", "Could you explain more?")
-    }
-
-
-
-def count_ai_questions(conversation):
-    return sum(
-        1 for turn in conversation
-        if turn.get("role") == "ai"
-        and turn.get("type") == "question"
-    )
 
-
-def is_warmup_reply(text: str) -> bool:
-    if not text:
-        return True
-    return len(text.strip().split()) <= 3
+def twiml_response(vr: VoiceResponse):
+    with stage_timer("twiml", "twilio"):
+        body = str(vr)
+    return HttpResponse(body, content_type="text/xml")
 
 
 def twilio_record(vr: VoiceResponse):
@@ -60,6 +58,20 @@ def twilio_record(vr: VoiceResponse):
         method="POST"
     )
 
+def twilio_gather_speech(vr: VoiceResponse, prompt):
+    gather = vr.gather(
+        input="speech",
+        speech_timeout="auto",
+        language="en-IN",
+        action=f"{settings.BASE_URL}/voice/",
+        method="POST"
+    )
+    gather.say(prompt, voice="alice", language="en-IN")
+
+    # No speech heard: carry on with the first question
+    vr.redirect(f"{settings.BASE_URL}/voice/", method="POST")
+
+
 def safe_record(vr, prompt=None):
     if prompt:
         vr.say(prompt, voice="alice", language="en-IN")
@@ -74,12 +86,145 @@ def safe_record(vr, prompt=None):
         method="POST"
     )
 
+def end_interview(vr, candidate):
+    vr.say(
+        "Thank you for your time. We have enough information for now. "
+        "Our HR team will contact you.",
+        voice="alice", language="en-IN"
+    )
+    vr.hangup()
+
+    # Hangup: the call's state goes back to the database
+    call_state.release(candidate)
+
+    if settings.SCORING_ASYNC:
+        # Scored by the "scoring" worker; the hangup is not held up
+        from interview.tasks import score_interview
+        score_interview.delay(candidate.id)
+    else:
+        save_candidate(candidate, apply_scores(candidate))
+
+    # The interview's token usage is complete once the call is over
+    llm_usage.flush()
+
+    return twiml_response(vr)
+
+
+def media_url(path):
+    return f"{settings.BASE_URL}{settings.MEDIA_URL}{os.path.relpath(path, 'media')}"
+
+
+def play_segment(vr, sentence, audio_path):
+    if audio_path:
+        vr.play(media_url(audio_path))
+    else:
+        # TTS failed for this sentence, let Twilio speak it
+        record_fallback("tts", "twilio_say")
+        vr.say(sentence, voice="alice", language="en-IN")
+
+
+def stream_next_question(vr, candidate, conversation, question_count):
+    # Only ask the LLM whether to stop once the minimum is covered
+    if question_count >= MIN_QUESTIONS:
+        end, _ = should_end_interview(conversation)
+        if end:
+            return end_interview(vr, candidate)
+
+    intent, sentences = stream_ai_question(conversation)
+
+    # A streamed question can't be regenerated once it plays, so check its
+    # opening sentence and take the deduplicated non-streaming turn instead
+    first = next(sentences, None)
+    if first is not None:
+        with stage_timer("question_dedup", "local"):
+            repeated = is_near_duplicate(first, asked_questions(conversation))
+        if repeated:
+            sentences.close()
+            record_fallback("question_dedup", "stream_repeat")
+            return ask_next_question(vr, candidate)
+        sentences = itertools.chain([first], sentences)
+
+    pipeline = start_pipeline(candidate.id, intent, sentences)
+    return play_ready_segments(vr, candidate, pipeline, 0)
+
+
+def ask_next_question(vr, candidate):
+    ai_turn = next_question(candidate)
+    if ai_turn["action"] == "end_interview":
+        return end_interview(vr, candidate)
+
+    vr.say(ai_turn["text"], voice="alice", language="en-IN")
+    twilio_record(vr)
+    return twiml_response(vr)
+
+
+def play_ready_segments(vr, candidate, pipeline, index):
+    """
+    Plays every segment that is already synthesized, then either redirects
+    to /voice/segment/ for the rest or starts recording the answer.
+    """
+    started = index > 0
+    sentence, audio_path = pipeline.segment(index)
+
+    while sentence is not None:
+        play_segment(vr, sentence, audio_path)
+        index += 1
+
+        if not pipeline.is_ready(index):
+            # Recorded now in case the pipeline is gone by the next webhook
+            save_streamed_question(candidate, pipeline.intent, pipeline.text_until(index), started)
+            vr.redirect(
+                f"{settings.BASE_URL}/voice/segment/?i={index}",
+                method="POST"
+            )
+            return twiml_response(vr)
+
+        sentence, audio_path = pipeline.segment(index)
+
+    finish_pipeline(candidate.id)
+
+    text = pipeline.text
+    if not text:
+        text = normalize_ai_turn({})["text"]
+        vr.say(text, voice="alice", language="en-IN")
+
+    save_streamed_question(candidate, pipeline.intent, text, started)
+
+    twilio_record(vr)
+    return twiml_response(vr)
+
+
+def save_streamed_question(candidate, intent, text, started):
+    """Appends the question being streamed, or updates it once more of it was played."""
+    conversation = candidate.conversation or []
+    entry = {
+        "role": "ai",
+        "type": "question",
+        "intent": intent,
+        "text": text
+    }
+
+    if started:
+        conversation[-1] = entry
+    else:
+        conversation.append(entry)
+
+    candidate.conversation = conversation
+    save_candidate(candidate, ["conversation"])
+
+
 @csrf_exempt
+@traced_webhook
+@call_state.write_behind
+@profiled("voice_interview")
+@timed("turn", "all")
 def voice_interview(request):
     vr = VoiceResponse()
     phone = request.POST.get("To") or request.POST.get("From")
 
-    candidate, _ = Candidate.objects.get_or_create(phone=phone)
+    candidate = call_state.load(phone, create=True)
+    bind_candidate(candidate.id)
+    merge_late_answer(candidate)
     conversation = candidate.conversation or []
 
     if not conversation:
@@ -96,98 +241,214 @@ def voice_interview(request):
             "text": intro_text
         })
         candidate.conversation = conversation
-        candidate.save(update_fields=["conversation"])
+        save_candidate(candidate, ["conversation"])
 
-        vr.say(intro_text, voice="alice", language="en-IN")
-        twilio_record(vr)
-        return HttpResponse(str(vr), content_type="text/xml")
+        if settings.STT_SPEECH_FAST_PATH:
+            # Readiness check only needs a short reply
+            twilio_gather_speech(vr, intro_text)
+        else:
+            vr.say(intro_text, voice="alice", language="en-IN")
+            twilio_record(vr)
+        return twiml_response(vr)
 
-    if "RecordingUrl" in request.POST:
-        recording_url = request.POST["RecordingUrl"] + ".wav"
-        local_path = f"media/recordings/{candidate.id}_{uuid.uuid4().hex}.wav"
+    if settings.TURN_ASYNC and not settings.TTS_STREAMING:
+        return enqueue_turn(vr, candidate, reply_params(request.POST))
 
-        audio = requests.get(
-            recording_url,
-            auth=HTTPBasicAuth(settings.TWILIO_SID, settings.TWILIO_AUTH)
-        )
+    text = transcribe_reply(candidate, reply_params(request.POST))
+    conversation = record_answer(candidate, text)
 
-        with open(local_path, "wb") as f:
-            f.write(audio.content)
-
-        text = transcribe_audio(local_path)
-        os.remove(local_path)
-
-        # Ignore warm-up replies
-        if not is_warmup_reply(text):
-            conversation.append({
-                "role": "candidate",
-                "type": "answer",
-                "text": text
-            })
-            candidate.conversation = conversation
-            candidate.save(update_fields=["conversation"])
-
-    question_count = count_ai_questions(conversation)
-    ai_turn = normalize_ai_turn(generate_ai_turn(conversation))
-
-    # 🚫 Enforce minimum questions
-    if question_count < MIN_QUESTIONS:
-        ai_turn["action"] = "ask_question"
-
-    if ai_turn["action"] == "end_interview" and question_count >= MIN_QUESTIONS:
-        vr.say(
-            "Thank you for your time. We have enough information for now. "
-            "Our HR team will contact you.",
-            voice="alice", language="en-IN"
-        )
-        vr.hangup()
+    if settings.TTS_STREAMING:
+        question_count = count_ai_questions(conversation)
+        return stream_next_question(vr, candidate, conversation, question_count)
 
-        result = evaluate_full_interview_from_conversation(
-            candidate.conversation
-        )
+    return ask_next_question(vr, candidate)
 
-        # ✅ SAVE EVERYTHING EXPLICITLY
-        candidate.final_score = result.get("final_score", 0)
-        candidate.decision = result.get("decision", "REJECT")
-        candidate.red_flags = result.get("red_flags", [])
-        candidate.hr_summary = result.get("hr_summary", "")
-        candidate.questions_asked = count_ai_questions(candidate.conversation)
-
-        candidate.save(
-            update_fields=[
-                "final_score",
-                "decision",
-                "red_flags",
-                "hr_summary",
-                "questions_asked",
-            ]
-        )
 
-        return HttpResponse(str(vr), content_type="text/xml")
+def hold(vr, turn_id, attempt):
+    """Keeps the caller on the line while the live queue works on the turn."""
+    if attempt == 0:
+        vr.say(settings.TURN_FILLER_TEXT, voice="alice", language="en-IN")
+    else:
+        vr.pause(length=settings.TURN_POLL_SECONDS)
 
-    conversation.append({
-        "role": "ai",
-        "type": "question",
-        "intent": ai_turn["intent"],
-        "text": ai_turn["text"]
-    })
-    candidate.conversation = conversation
-    candidate.save(update_fields=["conversation"])
+    vr.redirect(
+        f"{settings.BASE_URL}/voice/turn/?t={turn_id}&n={attempt + 1}",
+        method="POST"
+    )
+    return twiml_response(vr)
+
+
+def enqueue_turn(vr, candidate, params):
+    from interview.tasks import process_candidate_answer
+
+    turn_id = uuid.uuid4().hex
+    candidate.pending_turn = {"id": turn_id, "status": "processing"}
+    save_candidate(candidate, ["pending_turn"])
+
+    # The worker and /voice/turn/ read the row, not this process's state
+    call_state.release(candidate)
+
+    process_candidate_answer.delay(candidate.id, turn_id, params)
+    return hold(vr, turn_id, 0)
+
+
+@csrf_exempt
+@traced_webhook
+@timed("turn_poll", "all")
+def voice_turn(request):
+    vr = VoiceResponse()
+    phone = request.POST.get("To") or request.POST.get("From")
+    candidate = Candidate.objects.get(phone=phone)
+    bind_candidate(candidate.id)
+
+    turn_id = request.GET.get("t")
+    try:
+        attempt = int(request.GET.get("n", 1))
+    except ValueError:
+        attempt = 1
+    pending = candidate.pending_turn or {}
+
+    if not turn_id or pending.get("id") != turn_id or pending.get("status") not in TURN_SERVABLE:
+        # Superseded or already served; carry on with the answer
+        twilio_record(vr)
+        return twiml_response(vr)
+
+    if pending["status"] == "processing" and attempt < settings.TURN_POLL_MAX:
+        return hold(vr, turn_id, attempt)
+
+    if pending["status"] == "ready":
+        ai_turn = {key: pending[key] for key in ("action", "intent", "text")}
+    else:
+        # Worker failed or is too slow; don't leave the caller in silence
+        record_fallback("turn_async", "failed" if pending["status"] == "failed" else "timeout")
+        ai_turn = normalize_ai_turn({})
+
+    # A worker that is still busy may yet deliver the answer
+    late_turn_id = turn_id if pending["status"] == "processing" else None
+    serve_turn(candidate, pending.get("answer"), ai_turn, late_turn_id)
+
+    if ai_turn["action"] == "end_interview":
+        return end_interview(vr, candidate)
 
     vr.say(ai_turn["text"], voice="alice", language="en-IN")
     twilio_record(vr)
-    return HttpResponse(str(vr), content_type="text/xml")
+    return twiml_response(vr)
+
+
+@csrf_exempt
+@traced_webhook
+@call_state.write_behind
+def voice_segment(request):
+    vr = VoiceResponse()
+    phone = request.POST.get("To") or request.POST.get("From")
+    candidate = call_state.load(phone)
+    bind_candidate(candidate.id)
+
+    pipeline = get_pipeline(candidate.id)
+    if pipeline is None:
+        # Served by another worker or restarted mid-question. The part
+        # already played is in the conversation; move on to the answer
+        twilio_record(vr)
+        return twiml_response(vr)
+
+    index = int(request.GET.get("i", 0))
+    return play_ready_segments(vr, candidate, pipeline, index)
+
+
+@csrf_exempt
+@traced_webhook
+def voice_status(request):
+    handle_status(
+        request.POST.get("CallSid"),
+        request.POST.get("CallStatus")
+    )
+
+    # Candidate hung up before the interview ended
+    if request.POST.get("CallStatus") == "completed":
+        phone = request.POST.get("To")
+        call_state.release_phone(phone)
+
+        candidate_id = Candidate.objects.filter(phone=phone).values_list("id", flat=True).first()
+        if candidate_id is not None:
+            finish_pipeline(candidate_id)
+
+    return HttpResponse(status=204)
+
+
+@staff_member_required
+def export_candidates(request):
+    fmt = "csv" if request.GET.get("format") == "csv" else "ndjson"
+    gzip = request.GET.get("gzip") in ("1", "true")
+
+    try:
+        chunks = export_stream(
+            fmt=fmt,
+            gzip=gzip,
+            since=request.GET.get("since"),
+            until=request.GET.get("until"),
+            decision=request.GET.get("decision"),
+            include_conversation=request.GET.get("include") == "conversation",
+        )
+    except ValueError as e:
+        return HttpResponseBadRequest(str(e))
+
+    filename = f"candidates.{'csv' if fmt == 'csv' else 'ndjson'}" + (".gz" if gzip else "")
+    response = StreamingHttpResponse(
+        chunks,
+        content_type="text/csv" if fmt == "csv" else "application/x-ndjson"
+    )
+    if gzip:
+        response["Content-Type"] = "application/gzip"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+def metrics(request):
+    body, content_type = render_metrics()
+    return HttpResponse(body, content_type=content_type)
 
 
 def call_ui(request):
+    campaigns = Campaign.objects.filter(active=True).exclude(name=admission.MANUAL_CAMPAIGN)
+
     if request.method == "POST":
+        upload = request.FILES.get("candidates_file")
+        if upload:
+            campaign = campaigns.filter(id=request.POST.get("campaign") or None).first()
+
+            try:
+                stats = import_candidates(upload, campaign=campaign)
+            except ValueError as e:
+                message = str(e)
+            else:
+                message = (
+                    f"Imported {stats['imported']} of {stats['rows']} rows "
+                    f"({stats['duplicates']} duplicates, {stats['invalid']} invalid)"
+                )
+                if campaign:
+                    message += f", {stats['queued']} queued on {campaign.name}"
+
+            return render(
+                request,
+                "interview/call_ui.html",
+                {"message": message, "campaigns": campaigns}
+            )
+
         phone = request.POST.get("phone")
         if phone:
-            start_call(phone)
+            outcome = admission.request_call(phone)
+            if outcome == admission.PLACED:
+                message = "Call initiated successfully"
+            elif outcome == admission.QUEUED:
+                message = "At capacity: call queued and will be placed automatically"
+            elif outcome == admission.IN_CALL:
+                message = "This candidate is already being called"
+            else:
+                message = "Call could not be placed; it will be retried if attempts remain"
             return render(
                 request,
                 "interview/call_ui.html",
-                {"message": "Call initiated successfully"}
+                {"message": message, "campaigns": campaigns}
             )
 
-    return render(request, "interview/call_ui.html")
+    return render(request, "interview/call_ui.html", {"campaigns": campaigns})